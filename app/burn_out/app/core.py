@@ -12,7 +12,7 @@ from trame.widgets import quasar, html, client, rca, tauri
 from .assets import ASSETS, KWIVER_CONFIG
 from .ui import VideoControls, FileMenu, ViewMenu, HelpMenu, AboutDialog
 from .utils import VideoAdapter, wait_for_network_and_time
-from .video_importer import VideoImporter
+from .video_importer import VideoImporter, InProcessVideoImporter
 from .dialogs import TclTKDialog, TauriDialog
 from .world_view import WorldView
 
@@ -82,12 +82,16 @@ class BurnOutApp:
             self.server.controller.on_server_reload.add(self._build_ui)
 
         # Set state variable
-        self.state.trame__title = "Burn Out"
-        self.state.trame__favicon = ASSETS.favicon
-        self.state.video_loaded = False
-        self.state.ui_meta = []
-        self.state.video_play_speed_label = ""
-        self.state.log_stream = ""
+        self.state.update(
+            {
+                "trame__title": "Burn Out",
+                "trame__favicon": ASSETS.favicon,
+                "video_loaded": False,
+                "ui_meta": [],
+                "video_play_speed_label": "",
+                "log_stream": "",
+            }
+        )
         self.iostream = RedirectedStringIO(self.state)
 
         dual_handler = DualOutputHandler(self.iostream)
@@ -115,7 +119,6 @@ class BurnOutApp:
         self.video_source = None
         self.video_fps = 30
         self.video_previous_frame_index = -1
-        self.video_importer = VideoImporter(self.on_metadata_loaded)
 
         self.scene = Scene(self.server)
         self.world_view = WorldView(self.server)
@@ -133,6 +136,19 @@ class BurnOutApp:
             default=None,
         )
 
+        self.server.cli.add_argument(
+            "--in-process-import",
+            help="Extract video metadata in a thread of the server process instead "
+            "of a separate worker process. Skips the metadata file handoff, "
+            "faster if kwiver releases the GIL while reading the video",
+            action="store_true",
+        )
+
+        if self.cli_args.in_process_import:
+            self.video_importer = InProcessVideoImporter(self.on_metadata_loaded)
+        else:
+            self.video_importer = VideoImporter(self.on_metadata_loaded)
+
         if self.cli_args.use_tk:
             self.dialog = TclTKDialog()
         else:
@@ -189,6 +205,7 @@ class BurnOutApp:
     def on_client_connected(self, **kwargs):
         if self.state.video_loaded:
             # Force push image
+            self.video_adapter.clear()
             self.on_video_current_frame(1, True)
 
     @life_cycle.client_exited
@@ -217,12 +234,14 @@ class BurnOutApp:
         if file_to_load is None:
             return
         logger.debug("open file")
-        logger.debug(f" => {file_to_load=}")
+        logger.debug(" => file_to_load=%r", file_to_load)
         if self.video_source:
             self.video_source.close()
             self.state.video_loaded = False
             self.video_adapter.clear()
             self.video_previous_frame_index = -1
+        # The previous video's metadata is no longer wanted, stop extracting it
+        self.video_importer.cancel()
         # start extracting metadata in separate process
         self.video_importer.run(file_to_load, pick_video_reader_config(file_to_load))
 
@@ -367,7 +386,9 @@ class BurnOutApp:
                 # otherwise seek to the requested frame
                 self.video_source.seek_frame(ts, video_current_frame)
 
-        self.video_adapter.update_frame(self.video_source.frame_image())
+        self.video_adapter.update_frame(
+            self.video_source.frame_image(), frame_key=video_current_frame
+        )
         self.video_previous_frame_index = video_current_frame
         metadata = self.video_source.frame_metadata()[0]
         self.state.ui_meta = [
@@ -405,6 +426,9 @@ class BurnOutApp:
                 .no-transition.q-slider--inactive .q-slider__thumb--h {
                     transition: none !important;
                 }
+
+                /* hidden view toggle in the View menu */
+                .icon-off { opacity: 0.3; }
             """
             )
             self.ctrl.toggle_fullscreen = client.JSEval(
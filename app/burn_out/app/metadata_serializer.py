@@ -1,8 +1,8 @@
 """
 Metadata Serializer module for Burn Out application.
 
-This module provides simple functions to serialize metadata to JSON strings
-and deserialize from JSON strings using KWIVER's metadata functionality.
+This module provides simple functions to serialize metadata to JSON strings or
+files and deserialize from them using KWIVER's metadata functionality.
 """
 
 from typing import Dict, List, Optional
@@ -17,7 +17,14 @@ from kwiver.vital import vital_logging
 logger = vital_logging.getLogger(__name__)
 
 
-def serialize(frame_metadata: Dict[int, List]) -> str:
+def serialize_to_file(frame_metadata: Dict[int, List], path: str) -> None:
+    """
+    Serialize metadata to a JSON file.
+
+    Args:
+        frame_metadata: Dictionary mapping frame numbers to metadata lists.
+        path: Path of the JSON file to write.
+    """
     config = empty_config()
     config["metadata_writer:type"] = "json"
 
@@ -30,13 +37,40 @@ def serialize(frame_metadata: Dict[int, List]) -> str:
         logger.error("Failed to create metadata serializer")
         raise RuntimeError("Failed to create metadata serializer")
 
+    metadata_serializer.save(path, smm)
+
+
+def deserialize_file(path: str) -> Optional[Dict[int, List]]:
+    """
+    Deserialize metadata from a JSON file.
+
+    Args:
+        path: Path of the JSON file containing serialized metadata.
+
+    Returns:
+        Dictionary mapping frame numbers to metadata lists, or None if deserialization failed.
+    """
+    config = empty_config()
+    config["metadata_reader:type"] = "json"
+
+    metadata_deserializer = MetadataMapIO.set_nested_algo_configuration(
+        "metadata_reader", config
+    )
+    if metadata_deserializer is None:
+        logger.error("Failed to create metadata deserializer")
+        return None
+
+    return metadata_deserializer.load(path)
+
+
+def serialize(frame_metadata: Dict[int, List]) -> str:
     with tempfile.NamedTemporaryFile(
         mode="w+", suffix=".json", delete=False
     ) as temp_file:
         temp_filename = temp_file.name
 
     try:
-        metadata_serializer.save(temp_filename, smm)
+        serialize_to_file(frame_metadata, temp_filename)
         with open(temp_filename, "r") as f:
             metadata_json = f.read()
     finally:
@@ -56,16 +90,6 @@ def deserialize(json_str: str) -> Optional[Dict[int, List]]:
     Returns:
         Dictionary mapping frame numbers to metadata lists, or None if deserialization failed.
     """
-    config = empty_config()
-    config["metadata_reader:type"] = "json"
-
-    metadata_deserializer = MetadataMapIO.set_nested_algo_configuration(
-        "metadata_reader", config
-    )
-    if metadata_deserializer is None:
-        logger.error("Failed to create metadata deserializer")
-        return None
-
     with tempfile.NamedTemporaryFile(
         mode="w", suffix=".json", delete=False
     ) as temp_file:
@@ -73,9 +97,7 @@ def deserialize(json_str: str) -> Optional[Dict[int, List]]:
         temp_filename = temp_file.name
 
     try:
-        metadata_map = metadata_deserializer.load(temp_filename)
+        return deserialize_file(temp_filename)
     finally:
         if os.path.exists(temp_filename):
             os.unlink(temp_filename)
-
-    return metadata_map
@@ -10,44 +10,51 @@ import math
 logger = vital_logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
 
-
-def analyze_metadata_content(metadata_map):
+# Metadata tags reported on, by display name
+_ORIENTATION_TAGS = {
+    "platform_heading": mt.tags.VITAL_META_PLATFORM_HEADING_ANGLE,
+    "platform_pitch": mt.tags.VITAL_META_PLATFORM_PITCH_ANGLE,
+    "platform_roll": mt.tags.VITAL_META_PLATFORM_ROLL_ANGLE,
+    "sensor_azimuth": mt.tags.VITAL_META_SENSOR_REL_AZ_ANGLE,
+    "sensor_elevation": mt.tags.VITAL_META_SENSOR_REL_EL_ANGLE,
+    "sensor_roll": mt.tags.VITAL_META_SENSOR_REL_ROLL_ANGLE,
+}
+
+_TAG_SENSOR_LOCATION = mt.tags.VITAL_META_SENSOR_LOCATION
+
+_POSITION_TAGS = {
+    "sensor_location": _TAG_SENSOR_LOCATION,
+    "frame_center": mt.tags.VITAL_META_FRAME_CENTER,
+}
+
+_CAMERA_TAGS = {
+    "horizontal_fov": mt.tags.VITAL_META_SENSOR_HORIZONTAL_FOV,
+    "vertical_fov": mt.tags.VITAL_META_SENSOR_VERTICAL_FOV,
+    "image_width": mt.tags.VITAL_META_IMAGE_WIDTH,
+    "image_height": mt.tags.VITAL_META_IMAGE_HEIGHT,
+}
+
+
+def analyze_metadata_content(metadata_list):
     """
     Analyze metadata content and report what orientation data is available
     Similar to TeleSculptor's metadata analysis capabilities
     """
 
-    if not metadata_map:
+    if not metadata_list:
         logger.info("No metadata found in video")
         return
 
-    total_frames = len(metadata_map)
-    logger.info(f"Analyzing metadata for {total_frames} frames")
+    total_frames = len(metadata_list)
+    logger.info("Analyzing metadata for %d frames", total_frames)
 
     # Analyze orientation angles in detail
-    analyze_orientation_angles(metadata_map)
+    analyze_orientation_angles(metadata_list)
 
     # Track which metadata tags are present across all frames
-    orientation_tags = {
-        "platform_heading": mt.tags.VITAL_META_PLATFORM_HEADING_ANGLE,
-        "platform_pitch": mt.tags.VITAL_META_PLATFORM_PITCH_ANGLE,
-        "platform_roll": mt.tags.VITAL_META_PLATFORM_ROLL_ANGLE,
-        "sensor_azimuth": mt.tags.VITAL_META_SENSOR_REL_AZ_ANGLE,
-        "sensor_elevation": mt.tags.VITAL_META_SENSOR_REL_EL_ANGLE,
-        "sensor_roll": mt.tags.VITAL_META_SENSOR_REL_ROLL_ANGLE,
-    }
-
-    position_tags = {
-        "sensor_location": mt.tags.VITAL_META_SENSOR_LOCATION,
-        "frame_center": mt.tags.VITAL_META_FRAME_CENTER,
-    }
-
-    camera_tags = {
-        "horizontal_fov": mt.tags.VITAL_META_SENSOR_HORIZONTAL_FOV,
-        "vertical_fov": mt.tags.VITAL_META_SENSOR_VERTICAL_FOV,
-        "image_width": mt.tags.VITAL_META_IMAGE_WIDTH,
-        "image_height": mt.tags.VITAL_META_IMAGE_HEIGHT,
-    }
+    orientation_tags = _ORIENTATION_TAGS
+    position_tags = _POSITION_TAGS
+    camera_tags = _CAMERA_TAGS
 
     # Count how many frames have each tag
     tag_counts = {}
@@ -57,12 +64,12 @@ def analyze_metadata_content(metadata_map):
         count = 0
         sample_value = None
 
-        for frame_id, metadata in metadata_map.items():
+        for frame_id, metadata in metadata_list:
             if metadata.has(tag):
                 count += 1
                 if sample_value is None:
                     try:
-                        if tag == mt.tags.VITAL_META_SENSOR_LOCATION:
+                        if tag == _TAG_SENSOR_LOCATION:
                             sensor_loc = metadata.find(tag).data
                             if sensor_loc and hasattr(sensor_loc, "location"):
                                 loc = sensor_loc.location()
@@ -81,7 +88,7 @@ def analyze_metadata_content(metadata_map):
     logger.info("=== ORIENTATION METADATA ANALYSIS ===")
     orientation_complete = 0
 
-    for frame_id, metadata in metadata_map.items():
+    for frame_id, metadata in metadata_list:
         has_all_orientation = all(
             metadata.has(tag) for tag in orientation_tags.values()
         )
@@ -89,7 +96,9 @@ def analyze_metadata_content(metadata_map):
             orientation_complete += 1
 
     logger.info(
-        f"Frames with complete orientation data: {orientation_complete}/{total_frames}"
+        "Frames with complete orientation data: %d/%d",
+        orientation_complete,
+        total_frames,
     )
 
     for tag_name, count in tag_counts.items():
@@ -100,7 +109,9 @@ def analyze_metadata_content(metadata_map):
                 if sample_values[tag_name]
                 else ""
             )
-            logger.info(f"  {status} {tag_name}: {count}/{total_frames} frames{sample}")
+            logger.info(
+                "  %s %s: %d/%d frames%s", status, tag_name, count, total_frames, sample
+            )
 
     # Report position metadata
     logger.info("=== POSITION METADATA ANALYSIS ===")
@@ -112,7 +123,9 @@ def analyze_metadata_content(metadata_map):
                 if sample_values[tag_name]
                 else ""
             )
-            logger.info(f"  {status} {tag_name}: {count}/{total_frames} frames{sample}")
+            logger.info(
+                "  %s %s: %d/%d frames%s", status, tag_name, count, total_frames, sample
+            )
 
     # Report camera metadata
     logger.info("=== CAMERA METADATA ANALYSIS ===")
@@ -124,7 +137,9 @@ def analyze_metadata_content(metadata_map):
                 if sample_values[tag_name]
                 else ""
             )
-            logger.info(f"  {status} {tag_name}: {count}/{total_frames} frames{sample}")
+            logger.info(
+                "  %s %s: %d/%d frames%s", status, tag_name, count, total_frames, sample
+            )
 
     # Summary recommendation
     if orientation_complete == total_frames:
@@ -133,7 +148,9 @@ def analyze_metadata_content(metadata_map):
         )
     elif orientation_complete > 0:
         logger.info(
-            f"~ RESULT: {orientation_complete}/{total_frames} frames have complete orientation metadata - partial usage"
+            "~ RESULT: %d/%d frames have complete orientation metadata - partial usage",
+            orientation_complete,
+            total_frames,
         )
     else:
         logger.info(
@@ -141,17 +158,16 @@ def analyze_metadata_content(metadata_map):
         )
 
 
-def log_first_frame_metadata(metadata_map, max_tags=20):
+def log_first_frame_metadata(metadata_list, max_tags=20):
     """
     Log all metadata tags present in the first frame for debugging
     """
-    if not metadata_map:
+    if not metadata_list or not logger.isEnabledFor(logging.DEBUG):
         return
 
-    first_frame_id = next(iter(metadata_map))
-    first_metadata = metadata_map[first_frame_id]
+    first_frame_id, first_metadata = metadata_list[0]
 
-    logger.debug(f"=== FIRST FRAME METADATA TAGS (frame {first_frame_id}) ===")
+    logger.debug("=== FIRST FRAME METADATA TAGS (frame %s) ===", first_frame_id)
 
     # Get all available tags (this is a simplified approach)
     orientation_tags = [
@@ -170,36 +186,30 @@ def log_first_frame_metadata(metadata_map, max_tags=20):
             if first_metadata.has(tag):
                 try:
                     value = first_metadata.find(tag).as_double()
-                    logger.debug(f"  ✓ {tag_name}: {value:.2f}")
+                    logger.debug("  ✓ %s: %.2f", tag_name, value)
                 except Exception:
-                    logger.debug(f"  ✓ {tag_name}: present")
+                    logger.debug("  ✓ %s: present", tag_name)
             else:
-                logger.debug(f"  ✗ {tag_name}: missing")
+                logger.debug("  ✗ %s: missing", tag_name)
 
 
-def analyze_orientation_angles(metadata_map):
+def analyze_orientation_angles(metadata_list):
     """
     Analyze orientation angles in metadata and log detailed information about
     missing angles and sample values for debugging
     """
-    if not metadata_map:
+    # Everything below only feeds debug output, skip the per-frame scan otherwise
+    if not metadata_list or not logger.isEnabledFor(logging.DEBUG):
         return
 
-    total_frames = len(metadata_map)
-    orientation_tags = {
-        "platform_heading": mt.tags.VITAL_META_PLATFORM_HEADING_ANGLE,
-        "platform_pitch": mt.tags.VITAL_META_PLATFORM_PITCH_ANGLE,
-        "platform_roll": mt.tags.VITAL_META_PLATFORM_ROLL_ANGLE,
-        "sensor_azimuth": mt.tags.VITAL_META_SENSOR_REL_AZ_ANGLE,
-        "sensor_elevation": mt.tags.VITAL_META_SENSOR_REL_EL_ANGLE,
-        "sensor_roll": mt.tags.VITAL_META_SENSOR_REL_ROLL_ANGLE,
-    }
+    total_frames = len(metadata_list)
+    orientation_tags = _ORIENTATION_TAGS
 
     # Find first frame with complete orientation to log sample values
     sample_logged = False
     frames_with_missing_angles = 0
 
-    for frame_id, metadata in metadata_map.items():
+    for frame_id, metadata in metadata_list:
         missing_angles = []
         sample_values = {}
 
@@ -219,16 +229,18 @@ def analyze_orientation_angles(metadata_map):
 
         # Log sample values from first complete frame
         if not sample_logged and len(missing_angles) == 0:
-            logger.debug(f"Sample orientation metadata from frame {frame_id}:")
+            logger.debug("Sample orientation metadata from frame %s:", frame_id)
             logger.debug(
-                f"  Platform: heading={sample_values.get('platform_heading', 0):.1f}°, "
-                f"pitch={sample_values.get('platform_pitch', 0):.1f}°, "
-                f"roll={sample_values.get('platform_roll', 0):.1f}°"
+                "  Platform: heading=%.1f°, pitch=%.1f°, roll=%.1f°",
+                sample_values.get("platform_heading", 0),
+                sample_values.get("platform_pitch", 0),
+                sample_values.get("platform_roll", 0),
             )
             logger.debug(
-                f"  Sensor: azimuth={sample_values.get('sensor_azimuth', 0):.1f}°, "
-                f"elevation={sample_values.get('sensor_elevation', 0):.1f}°, "
-                f"roll={sample_values.get('sensor_roll', 0):.1f}°"
+                "  Sensor: azimuth=%.1f°, elevation=%.1f°, roll=%.1f°",
+                sample_values.get("sensor_azimuth", 0),
+                sample_values.get("sensor_elevation", 0),
+                sample_values.get("sensor_roll", 0),
             )
             sample_logged = True
 
@@ -238,13 +250,15 @@ def analyze_orientation_angles(metadata_map):
             # Log details for first few frames with missing data
             if frames_with_missing_angles <= 3:
                 logger.debug(
-                    f"Frame {frame_id} missing orientation angles: {missing_angles}"
+                    "Frame %s missing orientation angles: %s", frame_id, missing_angles
                 )
 
     # Log summary of missing angles
     if frames_with_missing_angles > 0:
         logger.debug(
-            f"Total frames with incomplete orientation metadata: {frames_with_missing_angles}/{total_frames}"
+            "Total frames with incomplete orientation metadata: %d/%d",
+            frames_with_missing_angles,
+            total_frames,
         )
         if frames_with_missing_angles > 3:
             logger.debug("  (Additional frames with missing data not shown)")
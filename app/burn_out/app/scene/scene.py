@@ -4,7 +4,6 @@ from kwiver.vital.types import (
     SimpleCameraPerspective,
     SimpleCameraIntrinsics,
     RotationD,
-    ned_to_enu,
     LocalCartesian,
     GeoPoint,
     geodesy,
@@ -15,12 +14,67 @@ import math
 import numpy as np
 import logging
 from .metadata_diagnostics import analyze_metadata_content
+from .utils import _batch_ned_to_enu_rotmat
 
 logger = vital_logging.getLogger(__name__)
 logger.setLevel(logging.DEBUG)
 
+# Metadata tags used in this module, resolved once
+_TAG_IMAGE_WIDTH = mt.tags.VITAL_META_IMAGE_WIDTH
+_TAG_IMAGE_HEIGHT = mt.tags.VITAL_META_IMAGE_HEIGHT
+_TAG_SLANT_RANGE = mt.tags.VITAL_META_SLANT_RANGE
+_TAG_TARGET_WIDTH = mt.tags.VITAL_META_TARGET_WIDTH
+_TAG_SENSOR_HORIZONTAL_FOV = mt.tags.VITAL_META_SENSOR_HORIZONTAL_FOV
+_TAG_SENSOR_VERTICAL_FOV = mt.tags.VITAL_META_SENSOR_VERTICAL_FOV
+_TAG_PLATFORM_HEADING_ANGLE = mt.tags.VITAL_META_PLATFORM_HEADING_ANGLE
+_TAG_PLATFORM_PITCH_ANGLE = mt.tags.VITAL_META_PLATFORM_PITCH_ANGLE
+_TAG_PLATFORM_ROLL_ANGLE = mt.tags.VITAL_META_PLATFORM_ROLL_ANGLE
+_TAG_SENSOR_REL_AZ_ANGLE = mt.tags.VITAL_META_SENSOR_REL_AZ_ANGLE
+_TAG_SENSOR_REL_EL_ANGLE = mt.tags.VITAL_META_SENSOR_REL_EL_ANGLE
+_TAG_SENSOR_REL_ROLL_ANGLE = mt.tags.VITAL_META_SENSOR_REL_ROLL_ANGLE
+_TAG_SENSOR_LOCATION = mt.tags.VITAL_META_SENSOR_LOCATION
+
+# Metadata read by compute_intrinsics_batch
+_INTRINSICS_TAGS = (
+    _TAG_IMAGE_WIDTH,
+    _TAG_IMAGE_HEIGHT,
+    _TAG_SLANT_RANGE,
+    _TAG_TARGET_WIDTH,
+    _TAG_SENSOR_HORIZONTAL_FOV,
+    _TAG_SENSOR_VERTICAL_FOV,
+)
+
+# Metadata stored as unsigned integers, every other tag read here is a double
+_UINT64_TAGS = frozenset((_TAG_IMAGE_WIDTH, _TAG_IMAGE_HEIGHT))
+
+# Platform yaw, pitch, roll then sensor yaw, pitch, roll
+_ORIENTATION_TAGS = (
+    _TAG_PLATFORM_HEADING_ANGLE,
+    _TAG_PLATFORM_PITCH_ANGLE,
+    _TAG_PLATFORM_ROLL_ANGLE,
+    _TAG_SENSOR_REL_AZ_ANGLE,
+    _TAG_SENSOR_REL_EL_ANGLE,
+    _TAG_SENSOR_REL_ROLL_ANGLE,
+)
+
+_DEG2RAD = math.pi / 180.0
+_HALF_DEG2RAD = 0.5 * _DEG2RAD
+
+# WGS84 ellipsoid semi-major axis (meters) and first eccentricity squared
+_WGS84_A = 6378137.0
+_WGS84_F = 1.0 / 298.257223563
+_WGS84_E2 = _WGS84_F * (2.0 - _WGS84_F)
+
 
 def make_camera_map(sfm_constraints, metadata, ignore_metadata=False):
+    """
+    Create the cameras of every frame of the metadata.
+
+    Returns:
+        tuple: (camera_map, camera_centers) where camera_centers is an (N, 3)
+               array of the camera_map centers in order, or None when the
+               metadata is ignored
+    """
     # Initialize base camera with TeleSculptor defaults from gui_default_camera_intrinsics.conf
     intrinsics = SimpleCameraIntrinsics()
     intrinsics.set_focal_length(12500.0)  # TeleSculptor default
@@ -31,34 +85,100 @@ def make_camera_map(sfm_constraints, metadata, ignore_metadata=False):
     base_camera = SimpleCameraPerspective()
     base_camera.set_intrinsics(intrinsics)
 
-    # only keep first metadata element for each frame
-    md_map = {
-        frame_id: metadata.get_vector(frame_id)[0] for frame_id in metadata.frames()
-    }
+    # only keep first metadata element for each frame, as (frame id, metadata)
+    # pairs in frame order
+    md_list = [
+        (frame_id, metadata.get_vector(frame_id)[0]) for frame_id in metadata.frames()
+    ]
 
     local_geo_cs = sfm_constraints.local_geo_cs
 
     if ignore_metadata:
         logger.info("Ignoring metadata - creating cameras with default poses")
         camera_map = {}
-        for frame_id in md_map.keys():
+        camera_centers = None
+        for frame_id, _ in md_list:
             camera_map[frame_id] = SimpleCameraPerspective(base_camera)
     else:
         # Try to find first valid intrinsics from metadata, similar to TeleSculptor
         # This provides better defaults when metadata is available
-        for frame_id, frame_metadata in md_map.items():
+        for frame_id, frame_metadata in md_list:
             metadata_intrinsics = intrinsics_from_metadata(frame_metadata)
             if metadata_intrinsics is not None:
                 base_camera.set_intrinsics(metadata_intrinsics)
                 break
 
-        analyze_metadata_content(md_map)
-        camera_map = initialize_cameras_with_metadata(md_map, base_camera, local_geo_cs)
+        analyze_metadata_content(md_list)
+        camera_map, camera_centers = initialize_cameras_with_metadata(
+            md_list, base_camera, local_geo_cs
+        )
 
     # Update the SFM constraints with the updated local coordinate system
     sfm_constraints.local_geo_cs = local_geo_cs
 
-    return camera_map
+    return camera_map, camera_centers
+
+
+def _set_image_size_from_metadata(intrinsics, metadata):
+    if metadata.has(_TAG_IMAGE_WIDTH):
+        md_image_width = metadata.find(_TAG_IMAGE_WIDTH).as_uint64()
+        if md_image_width > 0:
+            intrinsics.set_image_width(int(md_image_width))
+
+    if metadata.has(_TAG_IMAGE_HEIGHT):
+        md_image_height = metadata.find(_TAG_IMAGE_HEIGHT).as_uint64()
+        if md_image_height > 0:
+            intrinsics.set_image_height(int(md_image_height))
+
+
+def _set_focal_from_slant_target(intrinsics, metadata):
+    slant_range = metadata.find(_TAG_SLANT_RANGE).as_double()
+    target_width = metadata.find(_TAG_TARGET_WIDTH).as_double()
+
+    image_width = intrinsics.image_width()
+    if image_width <= 0:
+        image_width = 1920
+
+    focal_length = (image_width * slant_range) / target_width
+    intrinsics.set_focal_length(focal_length)
+
+
+def _set_focal_from_hfov(intrinsics, metadata):
+    horizontal_fov_rad = (
+        metadata.find(_TAG_SENSOR_HORIZONTAL_FOV).as_double() * _DEG2RAD
+    )
+    image_width = intrinsics.image_width()
+    if image_width <= 0:
+        image_width = 1920
+
+    focal_length = (image_width / 2.0) / math.tan(horizontal_fov_rad / 2.0)
+    intrinsics.set_focal_length(focal_length)
+    return focal_length
+
+
+def _set_focal_from_hfov_vfov(intrinsics, metadata):
+    focal_length = _set_focal_from_hfov(intrinsics, metadata)
+
+    # Vertical FOV is also available, compute aspect ratio
+    vertical_fov_rad = metadata.find(_TAG_SENSOR_VERTICAL_FOV).as_double() * _DEG2RAD
+    image_height = intrinsics.image_height()
+    if image_height <= 0:
+        image_height = 1080
+
+    focal_y = (image_height / 2.0) / math.tan(vertical_fov_rad / 2.0)
+    # Note: focal_length here is from horizontal FOV
+    aspect_ratio = focal_length / focal_y
+    intrinsics.set_aspect_ratio(aspect_ratio)
+
+
+def _center_principal_point(intrinsics):
+    # Set principal point to the center of the image if it's currently (0,0)
+    # and image dimensions are now known and non-zero.
+    # This mirrors the C++ kwiver::vital::intrinsics_from_metadata logic.
+    image_width = intrinsics.image_width()
+    image_height = intrinsics.image_height()
+    if image_width > 0 and image_height > 0:
+        intrinsics.set_principal_point([image_width / 2.0, image_height / 2.0])
 
 
 def intrinsics_from_metadata(metadata, camera_intrinsics=None):
@@ -71,59 +191,157 @@ def intrinsics_from_metadata(metadata, camera_intrinsics=None):
     else:
         intrinsics = SimpleCameraIntrinsics(camera_intrinsics)
 
-    if metadata.has(mt.tags.VITAL_META_IMAGE_WIDTH):
-        md_image_width = metadata.find(mt.tags.VITAL_META_IMAGE_WIDTH).as_uint64()
-        if md_image_width > 0:
-            intrinsics.set_image_width(int(md_image_width))
-
-    if metadata.has(mt.tags.VITAL_META_IMAGE_HEIGHT):
-        md_image_height = metadata.find(mt.tags.VITAL_META_IMAGE_HEIGHT).as_uint64()
-        if md_image_height > 0:
-            intrinsics.set_image_height(int(md_image_height))
+    _set_image_size_from_metadata(intrinsics, metadata)
 
     # Try to compute focal length
-    if metadata.has(mt.tags.VITAL_META_SLANT_RANGE) and metadata.has(
-        mt.tags.VITAL_META_TARGET_WIDTH
+    if metadata.has(_TAG_SLANT_RANGE) and metadata.has(_TAG_TARGET_WIDTH):
+        _set_focal_from_slant_target(intrinsics, metadata)
+    elif metadata.has(_TAG_SENSOR_HORIZONTAL_FOV):
+        if metadata.has(_TAG_SENSOR_VERTICAL_FOV):
+            _set_focal_from_hfov_vfov(intrinsics, metadata)
+        else:
+            _set_focal_from_hfov(intrinsics, metadata)
+
+    _center_principal_point(intrinsics)
+
+    return intrinsics
+
+
+def set_camera_center_from_metadata(camera, metadata, local_geo_cs):
+    """
+    Set the camera center from the sensor location metadata.
+
+    Returns:
+        bool: whether the metadata had a valid sensor location
+    """
+    if not metadata.has(_TAG_SENSOR_LOCATION):
+        return False
+
+    sensor_loc_object = metadata.find(_TAG_SENSOR_LOCATION).data
+    if sensor_loc_object is None or not callable(
+        getattr(sensor_loc_object, "location", None)
     ):
-        slant_range = metadata.find(mt.tags.VITAL_META_SLANT_RANGE).as_double()
-        target_width = metadata.find(mt.tags.VITAL_META_TARGET_WIDTH).as_double()
+        return False
+
+    # Match TeleSculptor's coordinate conversion:
+    # vector_3d loc = gloc.location( lgcs.origin().crs() ) - lgcs.origin().location();
+    if local_geo_cs and hasattr(local_geo_cs, "geo_origin") and local_geo_cs.geo_origin:
+        # Get location in the same CRS as origin, then subtract origin location
+        origin_crs = local_geo_cs.geo_origin.crs()
+        sensor_location_in_origin_crs = sensor_loc_object.location(origin_crs)
+        origin_location = local_geo_cs.geo_origin.location()
+
+        # Compute local coordinates by subtracting origin
+        local_coords = sensor_location_in_origin_crs - origin_location
+        camera.set_center(local_coords)
+    else:
+        # No origin set yet, use raw location (will be fixed later when origin is set)
+        camera.set_center(sensor_loc_object.location())
 
-        image_width = intrinsics.image_width() if intrinsics.image_width() > 0 else 1920
+    return True
 
-        focal_length = (image_width * slant_range) / target_width
-        intrinsics.set_focal_length(focal_length)
-    elif metadata.has(mt.tags.VITAL_META_SENSOR_HORIZONTAL_FOV):
-        horizontal_fov_rad = math.radians(
-            metadata.find(mt.tags.VITAL_META_SENSOR_HORIZONTAL_FOV).as_double()
-        )
-        image_width = intrinsics.image_width() if intrinsics.image_width() > 0 else 1920
 
-        focal_length = (image_width / 2.0) / math.tan(horizontal_fov_rad / 2.0)
-        intrinsics.set_focal_length(focal_length)
+def orientation_angles_from_metadata(metadata):
+    """
+    Get the platform and sensor yaw, pitch, roll angles (degrees) from metadata.
 
-        # If vertical FOV is also available, compute aspect ratio
-        if metadata.has(mt.tags.VITAL_META_SENSOR_VERTICAL_FOV):
-            vertical_fov_rad = math.radians(
-                metadata.find(mt.tags.VITAL_META_SENSOR_VERTICAL_FOV).as_double()
-            )
-            image_height = (
-                intrinsics.image_height() if intrinsics.image_height() > 0 else 1080
-            )
+    Returns:
+        list: [platform_yaw, platform_pitch, platform_roll,
+               sensor_yaw, sensor_pitch, sensor_roll]. Missing angles are NaN,
+               except sensor roll which C++ defaults to 0 if the tag is missing.
+    """
+    has_tag = metadata.has
+    find_tag = metadata.find
+    angles = []
+    for tag in _ORIENTATION_TAGS[:5]:
+        angles.append(find_tag(tag).as_double() if has_tag(tag) else math.nan)
+
+    if has_tag(_TAG_SENSOR_REL_ROLL_ANGLE):
+        angles.append(find_tag(_TAG_SENSOR_REL_ROLL_ANGLE).as_double())
+    else:
+        angles.append(0.0)
 
-            focal_y = (image_height / 2.0) / math.tan(vertical_fov_rad / 2.0)
-            # Note: focal_length here is from horizontal FOV
-            aspect_ratio = focal_length / focal_y
-            intrinsics.set_aspect_ratio(aspect_ratio)
+    return angles
 
-    # Set principal point to the center of the image if it's currently (0,0)
-    # and image dimensions are now known and non-zero.
-    # This mirrors the C++ kwiver::vital::intrinsics_from_metadata logic.
-    if intrinsics.image_width() > 0 and intrinsics.image_height() > 0:
-        pp_x = intrinsics.image_width() / 2.0
-        pp_y = intrinsics.image_height() / 2.0
-        intrinsics.set_principal_point([pp_x, pp_y])
 
-    return intrinsics
+def extract_metadata_soa(metadata_list, tags, defaults=None):
+    """
+    Read scalar metadata values of every frame into one array per tag.
+
+    Args:
+        metadata_list: list of (frame id, metadata) pairs
+        tags: metadata tags to read, as doubles except for _UINT64_TAGS
+        defaults: optional dict of tag to the value used for frames missing
+                  that tag, NaN otherwise
+
+    Returns:
+        dict: tag to (N,) float64 array, in metadata_list order
+    """
+    defaults = defaults or {}
+    n_frames = len(metadata_list)
+    soa = {tag: np.full(n_frames, defaults.get(tag, np.nan)) for tag in tags}
+    # kwiver typed getters do not convert, read each tag with its own type
+    columns = [
+        (tag, values, "as_uint64" if tag in _UINT64_TAGS else "as_double")
+        for tag, values in soa.items()
+    ]
+
+    for i, (_, metadata) in enumerate(metadata_list):
+        has_tag = metadata.has
+        find_tag = metadata.find
+        for tag, values, getter in columns:
+            if has_tag(tag):
+                values[i] = getattr(find_tag(tag), getter)()
+
+    return soa
+
+
+def compute_intrinsics_batch(soa, base_intrinsics):
+    """
+    Batched intrinsics_from_metadata over metadata arrays from
+    extract_metadata_soa (must include _INTRINSICS_TAGS).
+
+    Returns:
+        tuple: (focal_lengths, aspect_ratios, image_widths, image_heights)
+               (N,) arrays, base_intrinsics values where metadata is missing
+    """
+    md_widths = soa[_TAG_IMAGE_WIDTH]
+    md_heights = soa[_TAG_IMAGE_HEIGHT]
+    slant_ranges = soa[_TAG_SLANT_RANGE]
+    target_widths = soa[_TAG_TARGET_WIDTH]
+    horizontal_fovs = soa[_TAG_SENSOR_HORIZONTAL_FOV]
+    vertical_fovs = soa[_TAG_SENSOR_VERTICAL_FOV]
+
+    # NaN (missing) compares False, keeping the base dimensions
+    image_widths = np.where(md_widths > 0, md_widths, base_intrinsics.image_width())
+    image_heights = np.where(
+        md_heights > 0, md_heights, base_intrinsics.image_height()
+    )
+    image_widths = image_widths.astype(np.int64)
+    image_heights = image_heights.astype(np.int64)
+    focal_widths = np.where(image_widths > 0, image_widths, 1920)
+    focal_heights = np.where(image_heights > 0, image_heights, 1080)
+
+    use_slant_range = ~np.isnan(slant_ranges) & ~np.isnan(target_widths)
+    use_horizontal_fov = ~use_slant_range & ~np.isnan(horizontal_fovs)
+    use_vertical_fov = use_horizontal_fov & ~np.isnan(vertical_fovs)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        slant_focals = (focal_widths * slant_ranges) / target_widths
+        fov_focals = (focal_widths / 2.0) / np.tan(horizontal_fovs * _HALF_DEG2RAD)
+        focal_ys = (focal_heights / 2.0) / np.tan(vertical_fovs * _HALF_DEG2RAD)
+
+        focal_lengths = np.where(
+            use_slant_range,
+            slant_focals,
+            np.where(use_horizontal_fov, fov_focals, base_intrinsics.focal_length()),
+        )
+        # Note: focal_length here is from horizontal FOV
+        aspect_ratios = np.where(
+            use_vertical_fov, fov_focals / focal_ys, base_intrinsics.aspect_ratio()
+        )
+
+    return focal_lengths, aspect_ratios, image_widths, image_heights
 
 
 def update_camera_from_metadata(camera, metadata, local_geo_cs):
@@ -139,205 +357,230 @@ def update_camera_from_metadata(camera, metadata, local_geo_cs):
     Returns:
         tuple: (updated_camera, success) where success indicates if metadata was valid
     """
-    has_valid_position = False
-    has_valid_orientation = False
-
-    if metadata.has(mt.tags.VITAL_META_SENSOR_LOCATION):
-        sensor_loc_object = metadata.find(mt.tags.VITAL_META_SENSOR_LOCATION).data
-        if sensor_loc_object is not None and callable(
-            getattr(sensor_loc_object, "location", None)
-        ):
-            # Match TeleSculptor's coordinate conversion:
-            # vector_3d loc = gloc.location( lgcs.origin().crs() ) - lgcs.origin().location();
-            if (
-                local_geo_cs
-                and hasattr(local_geo_cs, "geo_origin")
-                and local_geo_cs.geo_origin
-            ):
-                # Get location in the same CRS as origin, then subtract origin location
-                origin_crs = local_geo_cs.geo_origin.crs()
-                sensor_location_in_origin_crs = sensor_loc_object.location(origin_crs)
-                origin_location = local_geo_cs.geo_origin.location()
-
-                # Compute local coordinates by subtracting origin
-                local_coords = sensor_location_in_origin_crs - origin_location
-                camera.set_center(local_coords)
-            else:
-                # No origin set yet, use raw location (will be fixed later when origin is set)
-                camera.set_center(sensor_loc_object.location())
-
-            has_valid_position = True
-
-    # Get platform and sensor orientation angles
-    platform_yaw_deg = 0.0
-    platform_pitch_deg = 0.0
-    platform_roll_deg = 0.0
-    sensor_yaw_deg = 0.0
-    sensor_pitch_deg = 0.0
-    sensor_roll_deg = (
-        0.0  # Initialize sensor_roll_deg, C++ defaults this to 0 if tag is missing
+    has_valid_position = set_camera_center_from_metadata(
+        camera, metadata, local_geo_cs
     )
 
-    has_platform_yaw = False
-    has_platform_pitch = False
-    has_platform_roll = False
-    has_sensor_yaw = False
-    has_sensor_pitch = False
-
-    if metadata.has(mt.tags.VITAL_META_PLATFORM_HEADING_ANGLE):
-        platform_yaw_deg = metadata.find(
-            mt.tags.VITAL_META_PLATFORM_HEADING_ANGLE
-        ).as_double()
-        has_platform_yaw = True
-    if metadata.has(mt.tags.VITAL_META_PLATFORM_PITCH_ANGLE):
-        platform_pitch_deg = metadata.find(
-            mt.tags.VITAL_META_PLATFORM_PITCH_ANGLE
-        ).as_double()
-        has_platform_pitch = True
-    if metadata.has(mt.tags.VITAL_META_PLATFORM_ROLL_ANGLE):
-        platform_roll_deg = metadata.find(
-            mt.tags.VITAL_META_PLATFORM_ROLL_ANGLE
-        ).as_double()
-        has_platform_roll = True
-
-    if metadata.has(mt.tags.VITAL_META_SENSOR_REL_AZ_ANGLE):
-        sensor_yaw_deg = metadata.find(
-            mt.tags.VITAL_META_SENSOR_REL_AZ_ANGLE
-        ).as_double()
-        has_sensor_yaw = True
-    if metadata.has(mt.tags.VITAL_META_SENSOR_REL_EL_ANGLE):
-        sensor_pitch_deg = metadata.find(
-            mt.tags.VITAL_META_SENSOR_REL_EL_ANGLE
-        ).as_double()
-        has_sensor_pitch = True
-    if metadata.has(mt.tags.VITAL_META_SENSOR_REL_ROLL_ANGLE):
-        sensor_roll_deg = metadata.find(
-            mt.tags.VITAL_META_SENSOR_REL_ROLL_ANGLE
-        ).as_double()
-
     # Condition to match C++ logic in camera_from_metadata.cxx
-    # Sensor roll is used in uas_ypr_to_rotation, and its NaN status matters.
-    # The C++ check requires platform YPR and sensor YP to be present and all angles (including sensor roll) to be non-NaN.
-    condition_met = (
-        has_platform_yaw
-        and has_platform_pitch
-        and has_platform_roll
-        and has_sensor_yaw
-        and has_sensor_pitch  # Sensor roll presence isn't strictly required for the condition, as it defaults to 0
-        and not (
-            math.isnan(platform_yaw_deg)
-            or math.isnan(platform_pitch_deg)
-            or math.isnan(platform_roll_deg)
-            or math.isnan(sensor_yaw_deg)
-            or math.isnan(sensor_pitch_deg)
-            or math.isnan(sensor_roll_deg)
-        )
-    )
-
-    if not condition_met:
+    # The C++ check requires platform YPR and sensor YP to be present and all
+    # angles (including sensor roll) to be non-NaN, missing angles are NaN here.
+    yprs = np.array([orientation_angles_from_metadata(metadata)])
+    if np.isnan(yprs).any():
         # Return camera and success status - must have either position or orientation
         return camera, has_valid_position
 
-    has_valid_orientation = True
-    platform_yaw_rad = math.radians(platform_yaw_deg)
-    platform_pitch_rad = math.radians(platform_pitch_deg)
-    platform_roll_rad = math.radians(platform_roll_deg)
-
-    sensor_yaw_rad = math.radians(sensor_yaw_deg)
-    sensor_pitch_rad = math.radians(sensor_pitch_deg)
-    sensor_roll_rad = math.radians(sensor_roll_deg)
-
-    platform_rotation_ned = RotationD(
-        platform_yaw_rad, platform_pitch_rad, platform_roll_rad
+    camera.set_rotation(RotationD(_batch_ned_to_enu_rotmat(np.deg2rad(yprs))[0]))
+
+    # Return camera and success status - has valid orientation
+    return camera, True
+
+
+def _geodetic_to_ecef(lats, lons, alts):
+    lat = np.asarray(lats) * _DEG2RAD
+    lon = np.asarray(lons) * _DEG2RAD
+    sin_lat = np.sin(lat)
+    cos_lat = np.cos(lat)
+    prime_vertical = _WGS84_A / np.sqrt(1.0 - _WGS84_E2 * sin_lat * sin_lat)
+    return np.stack(
+        [
+            (prime_vertical + alts) * cos_lat * np.cos(lon),
+            (prime_vertical + alts) * cos_lat * np.sin(lon),
+            (prime_vertical * (1.0 - _WGS84_E2) + alts) * sin_lat,
+        ],
+        axis=-1,
     )
 
-    sensor_rotation_ned = RotationD(sensor_yaw_rad, sensor_pitch_rad, sensor_roll_rad)
 
-    combined_rotation_ned = platform_rotation_ned * sensor_rotation_ned
+def geodetic_to_enu_batch(lats, lons, alts, origin):
+    """
+    Convert WGS84 geodetic coordinates to local east-north-up coordinates.
 
-    final_rotation_enu = ned_to_enu(combined_rotation_ned)
+    Vectorized equivalent of LocalCartesian(origin, 0.0).convert_to_cartesian
+    applied to each point.
 
+    Args:
+        lats, lons, alts: (N,) arrays of latitude, longitude (degrees) and
+                          altitude (meters)
+        origin: (lat, lon, alt) of the local frame origin
 
-    camera.set_rotation(final_rotation_enu)
+    Returns:
+        (N, 3) array of local east, north, up coordinates
+    """
+    origin_lat, origin_lon, origin_alt = origin
+    ecef = _geodetic_to_ecef(
+        np.asarray(lats, dtype=np.float64),
+        np.asarray(lons, dtype=np.float64),
+        np.asarray(alts, dtype=np.float64),
+    )
+    origin_ecef = _geodetic_to_ecef(
+        np.float64(origin_lat), np.float64(origin_lon), np.float64(origin_alt)
+    )
 
-    # Return camera and success status - has either valid position or valid orientation
-    return camera, has_valid_position or has_valid_orientation
+    lat0 = origin_lat * _DEG2RAD
+    lon0 = origin_lon * _DEG2RAD
+    ecef_to_enu = np.array(
+        [
+            [-math.sin(lon0), math.cos(lon0), 0.0],
+            [
+                -math.sin(lat0) * math.cos(lon0),
+                -math.sin(lat0) * math.sin(lon0),
+                math.cos(lat0),
+            ],
+            [
+                math.cos(lat0) * math.cos(lon0),
+                math.cos(lat0) * math.sin(lon0),
+                math.sin(lat0),
+            ],
+        ]
+    )
+    return (ecef - origin_ecef) @ ecef_to_enu.T
 
 
-def initialize_cameras_with_metadata(metadata_map, base_camera, local_geo_cs):
+def initialize_cameras_with_metadata(metadata_list, base_camera, local_geo_cs):
     """
-    Initialize cameras from metadata map
+    Initialize cameras from a list of (frame id, metadata) pairs
     Port of C++ initialize_cameras_with_metadata function
+
+    Returns:
+        tuple: (camera_map, camera_centers) with the (N, 3) array of the
+               camera_map centers, in camera_map order
     """
 
-    logger.debug(f"Initializing {len(metadata_map)} cameras from metadata")
+    logger.debug("Initializing %d cameras from metadata", len(metadata_list))
 
     camera_map = {}
 
-    origin_set = False
-    for frame_id, metadata in metadata_map.items():
-        if metadata.has(mt.tags.VITAL_META_SENSOR_LOCATION) and not origin_set:
-            sensor_loc = metadata.find(mt.tags.VITAL_META_SENSOR_LOCATION).data
-            # Set origin to ground level (altitude = 0) like TeleSculptor
-            # This ensures cameras appear above the ground plane
-            ground_origin = GeoPoint(sensor_loc.location(), sensor_loc.crs())
-            loc = ground_origin.location()
-            loc[2] = 0.0  # Set altitude to 0
-            ground_origin.set_location(loc, ground_origin.crs())
-            local_geo_cs.geo_origin = ground_origin
-            origin_set = True
-            break
-
-    # Create cameras from metadata
-    camera_centers = []
-    cameras_with_orientation = 0
-
-    for frame_id, metadata in metadata_map.items():
-        # Create camera intrinsics from metadata
-        camera_intrinsics = intrinsics_from_metadata(metadata, base_camera.intrinsics())
-
-        # Create new camera with updated intrinsics
+    has_location = [
+        metadata.has(_TAG_SENSOR_LOCATION) for _, metadata in metadata_list
+    ]
+
+    # Origin from the first frame with a sensor location
+    origin_metadata = next(
+        (
+            metadata
+            for (_, metadata), metadata_has_location in zip(
+                metadata_list, has_location
+            )
+            if metadata_has_location
+        ),
+        None,
+    )
+    origin_set = origin_metadata is not None
+    if origin_set:
+        sensor_loc = origin_metadata.find(_TAG_SENSOR_LOCATION).data
+        # Set origin to ground level (altitude = 0) like TeleSculptor
+        # This ensures cameras appear above the ground plane
+        ground_origin = GeoPoint(sensor_loc.location(), sensor_loc.crs())
+        loc = ground_origin.location()
+        loc[2] = 0.0  # Set altitude to 0
+        ground_origin.set_location(loc, ground_origin.crs())
+        local_geo_cs.geo_origin = ground_origin
+
+    # Read all the scalar metadata needed for the cameras in one pass
+    soa = extract_metadata_soa(
+        metadata_list,
+        _INTRINSICS_TAGS + _ORIENTATION_TAGS,
+        defaults={_TAG_SENSOR_REL_ROLL_ANGLE: 0.0},
+    )
+    base_intrinsics = base_camera.intrinsics()
+    focal_lengths, aspect_ratios, image_widths, image_heights = (
+        compute_intrinsics_batch(soa, base_intrinsics)
+    )
+    has_principal_point = (image_widths > 0) & (image_heights > 0)
+
+    # Frames without any intrinsics metadata end up with the base intrinsics
+    # unchanged (as long as its principal point is already the image center),
+    # those cameras keep the base camera intrinsics object
+    base_width = base_intrinsics.image_width()
+    base_height = base_intrinsics.image_height()
+    base_is_centered = (base_width <= 0 or base_height <= 0) or np.allclose(
+        base_intrinsics.principal_point(), [base_width / 2.0, base_height / 2.0]
+    )
+    keeps_base_intrinsics = base_is_centered & np.isnan(
+        np.column_stack([soa[tag] for tag in _INTRINSICS_TAGS])
+    ).all(axis=1)
+
+    # Compute all camera rotations at once, frames with a missing or NaN
+    # angle keep their default orientation (same check as update_camera_from_metadata)
+    frame_yprs_rad = np.deg2rad(
+        np.column_stack([soa[tag] for tag in _ORIENTATION_TAGS])
+    )
+    has_valid_orientation = ~np.isnan(frame_yprs_rad).any(axis=1)
+    rotations = _batch_ned_to_enu_rotmat(frame_yprs_rad)
+    cameras_with_orientation = int(np.count_nonzero(has_valid_orientation))
+
+    # Create cameras from metadata, frames with the same intrinsics values
+    # (usually all of them for a fixed lens) share one intrinsics object
+    intrinsics_cache = {}
+    cameras = []
+    for i, (frame_id, metadata) in enumerate(metadata_list):
         camera = SimpleCameraPerspective(base_camera)
-        camera.set_intrinsics(camera_intrinsics)
-
-        # Check if this frame has complete orientation metadata before updating
-        has_complete_orientation = (
-            metadata.has(mt.tags.VITAL_META_PLATFORM_HEADING_ANGLE)
-            and metadata.has(mt.tags.VITAL_META_PLATFORM_PITCH_ANGLE)
-            and metadata.has(mt.tags.VITAL_META_PLATFORM_ROLL_ANGLE)
-            and metadata.has(mt.tags.VITAL_META_SENSOR_REL_AZ_ANGLE)
-            and metadata.has(mt.tags.VITAL_META_SENSOR_REL_EL_ANGLE)
-        )
 
-        if has_complete_orientation:
-            cameras_with_orientation += 1
+        if not keeps_base_intrinsics[i]:
+            intrinsics_key = (
+                int(image_widths[i]),
+                int(image_heights[i]),
+                round(float(focal_lengths[i]), 6),
+                round(float(aspect_ratios[i]), 6),
+            )
+            camera_intrinsics = intrinsics_cache.get(intrinsics_key)
+            if camera_intrinsics is None:
+                # Create camera intrinsics from metadata
+                camera_intrinsics = SimpleCameraIntrinsics(base_intrinsics)
+                camera_intrinsics.set_image_width(int(image_widths[i]))
+                camera_intrinsics.set_image_height(int(image_heights[i]))
+                camera_intrinsics.set_focal_length(float(focal_lengths[i]))
+                camera_intrinsics.set_aspect_ratio(float(aspect_ratios[i]))
+                if has_principal_point[i]:
+                    camera_intrinsics.set_principal_point(
+                        [image_widths[i] / 2.0, image_heights[i] / 2.0]
+                    )
+                intrinsics_cache[intrinsics_key] = camera_intrinsics
+
+            # Update the new camera with the metadata intrinsics
+            camera.set_intrinsics(camera_intrinsics)
+
+        # Update camera position from metadata, orientation is batched above
+        has_valid_position = has_location[i] and set_camera_center_from_metadata(
+            camera, metadata, local_geo_cs
+        )
+        cameras.append((frame_id, camera, has_valid_position))
 
-        # Update camera pose from metadata
-        camera, is_valid = update_camera_from_metadata(camera, metadata, local_geo_cs)
+    camera_centers = np.empty((len(cameras), 3))
+    num_centers = 0
+    for (frame_id, camera, has_valid_position), has_orientation, rotation in zip(
+        cameras, has_valid_orientation, rotations
+    ):
+        if has_orientation:
+            camera.set_rotation(RotationD(rotation))
 
         # Only add to camera map if metadata was valid (like TeleSculptor)
-        if is_valid:
+        if has_valid_position or has_orientation:
             camera_map[frame_id] = camera
             # Collect camera centers for local origin update
-            camera_centers.append(camera.center())
-
+            camera_centers[num_centers] = camera.center()
+            num_centers += 1
 
     # Update local origin to mean of camera positions if we have cameras
-    if camera_centers and origin_set:
+    if num_centers and origin_set:
         # Create LocalCartesian converter with current origin
         origin_geo = local_geo_cs.geo_origin
         converter = LocalCartesian(origin_geo, 0.0)
 
-        # Convert to local coordinates and compute mean
-        local_centers = []
-        for center in camera_centers:
-            # Convert numpy array center to GeoPoint, then to local cartesian
-            center_geo = GeoPoint(center, geodesy.SRID.lat_lon_WGS84)
-            local_center = converter.convert_to_cartesian(center_geo)
-            local_centers.append([local_center[0], local_center[1], local_center[2]])
+        # Convert to local coordinates (centers are lon, lat, alt) and compute mean
+        centers = camera_centers[:num_centers]
+        origin_lon, origin_lat, origin_alt = origin_geo.location(
+            geodesy.SRID.lat_lon_WGS84
+        )
+        local_centers = geodetic_to_enu_batch(
+            centers[:, 1],
+            centers[:, 0],
+            centers[:, 2],
+            (origin_lat, origin_lon, origin_alt),
+        )
 
         # Compute mean center
-        mean_center = np.mean(local_centers, axis=0)
+        mean_center = local_centers.mean(axis=0)
 
         # Only use mean easting and northing, keep altitude at 0 (like TeleSculptor)
         mean_center[2] = 0.0
@@ -350,11 +593,14 @@ def initialize_cameras_with_metadata(metadata_map, base_camera, local_geo_cs):
         local_geo_cs.geo_origin = mean_geo
 
     logger.info(
-        f"Camera initialization complete: {len(camera_map)}/{len(metadata_map)} frames have valid metadata, "
-        f"{cameras_with_orientation} have complete orientation data"
+        "Camera initialization complete: %d/%d frames have valid metadata, "
+        "%d have complete orientation data",
+        len(camera_map),
+        len(metadata_list),
+        cameras_with_orientation,
     )
 
-    return camera_map
+    return camera_map, camera_centers[:num_centers]
 
 
 @TrameApp()
@@ -373,7 +619,7 @@ class Scene:
         self.sfm_constraints = SFMConstraints()
         self.sfm_constraints.metadata = metadata
 
-        camera_map = make_camera_map(
+        camera_map, camera_centers = make_camera_map(
             self.sfm_constraints, metadata, self.ignore_metadata
         )
-        self.server.controller.update_camera_map(camera_map)
+        self.server.controller.update_camera_map(camera_map, camera_centers)
@@ -0,0 +1,69 @@
+"""Tests for the batched metadata reads of the camera initialization."""
+
+import numpy as np
+import pytest
+
+pytest.importorskip("kwiver.vital.types")
+pytest.importorskip("trame.decorators")
+
+from .scene import (  # noqa: E402
+    _INTRINSICS_TAGS,
+    _TAG_IMAGE_HEIGHT,
+    _TAG_IMAGE_WIDTH,
+    _TAG_SENSOR_HORIZONTAL_FOV,
+    _TAG_SLANT_RANGE,
+    extract_metadata_soa,
+)
+
+
+class FakeItem:
+    """Metadata item answering only the getter of its type, like kwiver."""
+
+    def __init__(self, value, typed_getter):
+        self._value = value
+        self._typed_getter = typed_getter
+
+    def _get(self, getter):
+        if getter != self._typed_getter:
+            raise TypeError(f"{self._typed_getter} item read with {getter}")
+        return self._value
+
+    def as_double(self):
+        return self._get("as_double")
+
+    def as_uint64(self):
+        return self._get("as_uint64")
+
+
+class FakeMetadata:
+    def __init__(self, items):
+        self._items = items
+
+    def has(self, tag):
+        return tag in self._items
+
+    def find(self, tag):
+        return self._items[tag]
+
+
+def test_extract_metadata_soa_reads_image_size_as_uint64():
+    metadata_list = [
+        (
+            1,
+            FakeMetadata(
+                {
+                    _TAG_IMAGE_WIDTH: FakeItem(1280, "as_uint64"),
+                    _TAG_IMAGE_HEIGHT: FakeItem(720, "as_uint64"),
+                    _TAG_SENSOR_HORIZONTAL_FOV: FakeItem(30.5, "as_double"),
+                }
+            ),
+        ),
+        (2, FakeMetadata({_TAG_SLANT_RANGE: FakeItem(1500.0, "as_double")})),
+    ]
+
+    soa = extract_metadata_soa(metadata_list, _INTRINSICS_TAGS)
+
+    np.testing.assert_array_equal(soa[_TAG_IMAGE_WIDTH], [1280.0, np.nan])
+    np.testing.assert_array_equal(soa[_TAG_IMAGE_HEIGHT], [720.0, np.nan])
+    np.testing.assert_array_equal(soa[_TAG_SENSOR_HORIZONTAL_FOV], [30.5, np.nan])
+    np.testing.assert_array_equal(soa[_TAG_SLANT_RANGE], [np.nan, 1500.0])
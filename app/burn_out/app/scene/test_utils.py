@@ -0,0 +1,206 @@
+"""Tests of the camera and frustum math against VTK, without kwiver."""
+
+import numpy as np
+import pytest
+from vtkmodules.util.numpy_support import vtk_to_numpy
+from vtkmodules.vtkCommonDataModel import vtkPlanes, vtkPolyData
+from vtkmodules.vtkCommonTransforms import vtkTransform
+from vtkmodules.vtkFiltersSources import vtkFrustumSource
+from vtkmodules.vtkRenderingCore import vtkCamera
+
+from .utils import (
+    _batch_ned_to_enu_rotmat,
+    _build_camera_params,
+    _frustum_planes_from_params,
+    build_camera_frustum,
+    compute_frustum_planes_batch,
+    create_vtk_camera_from_simple_camera,
+    get_frustum_planes,
+    get_frustum_planes_from_simple_camera,
+)
+
+NEAR_CLIP = 0.1
+FAR_CLIP = 50.0
+
+
+# Stand-ins for the kwiver camera types, with the accessors used by utils
+
+
+class FakeIntrinsics:
+    def __init__(self, width, height, focal_length, aspect_ratio, principal_point):
+        self._width = width
+        self._height = height
+        self._focal_length = focal_length
+        self._aspect_ratio = aspect_ratio
+        self._principal_point = principal_point
+
+    def image_width(self):
+        return self._width
+
+    def image_height(self):
+        return self._height
+
+    def focal_length(self):
+        return self._focal_length
+
+    def aspect_ratio(self):
+        return self._aspect_ratio
+
+    def principal_point(self):
+        return np.array(self._principal_point, dtype=float)
+
+
+class FakeRotation:
+    def __init__(self, matrix):
+        self._matrix = matrix
+
+    def matrix(self):
+        return self._matrix
+
+
+class FakeCamera:
+    def __init__(self, center, rotation, intrinsics):
+        self._center = np.array(center, dtype=float)
+        self._rotation = FakeRotation(rotation)
+        self._intrinsics = intrinsics
+
+    def center(self):
+        return self._center
+
+    def rotation(self):
+        return self._rotation
+
+    def intrinsics(self):
+        return self._intrinsics
+
+
+def random_rotation(rng):
+    q, r = np.linalg.qr(rng.normal(size=(3, 3)))
+    q *= np.sign(np.diag(r))
+    if np.linalg.det(q) < 0:
+        q[:, 0] = -q[:, 0]
+    return q
+
+
+def make_cameras(seed=0):
+    rng = np.random.default_rng(seed)
+    intrinsics = [
+        FakeIntrinsics(1920, 1080, 1500.0, 1.0, (960.0, 540.0)),
+        FakeIntrinsics(1280, 720, 12500.0, 1.1, (640.0, 360.0)),
+        FakeIntrinsics(720, 480, 200.0, 0.9, (360.0, 240.0)),
+        # Missing image size, estimated from the principal point
+        FakeIntrinsics(0, 0, 800.0, 1.0, (320.0, 240.0)),
+        # Missing focal length and aspect ratio
+        FakeIntrinsics(640, 480, 0.0, 0.0, (320.0, 240.0)),
+    ]
+    return [
+        FakeCamera(rng.uniform(-100.0, 100.0, 3), random_rotation(rng), ci)
+        for ci in intrinsics
+    ]
+
+
+def vtk_frustum_planes(camera, scale=1.0):
+    bundle = create_vtk_camera_from_simple_camera(camera, NEAR_CLIP, FAR_CLIP)
+    return get_frustum_planes(bundle, scale)
+
+
+@pytest.mark.parametrize("scale", [1.0, 0.25])
+def test_frustum_planes_from_simple_camera_match_vtk(scale):
+    for camera in make_cameras():
+        np.testing.assert_allclose(
+            get_frustum_planes_from_simple_camera(camera, NEAR_CLIP, FAR_CLIP, scale),
+            vtk_frustum_planes(camera, scale),
+            rtol=1e-9,
+            atol=1e-9,
+        )
+
+
+def test_frustum_planes_from_params_clamp_view_angle_like_vtk():
+    # A focal length much smaller than the image height gives a view angle
+    # over vtkCamera's 179 degree limit
+    params = _build_camera_params(
+        np.eye(3), (1.0, 2.0, 3.0), 640.0, 480.0, 1e-3, 1.0
+    )
+    vtk_cam = vtkCamera()
+    vtk_cam.SetViewAngle(params.view_angle)
+    vtk_cam.SetPosition(*params.position)
+    vtk_cam.SetViewUp(*params.view_up)
+    vtk_cam.SetFocalPoint(*params.focal_point)
+    vtk_cam.SetClippingRange(NEAR_CLIP, FAR_CLIP)
+    expected = np.empty((6, 4))
+    vtk_cam.GetFrustumPlanes(params.aspect_ratio, expected.ravel())
+
+    np.testing.assert_allclose(
+        _frustum_planes_from_params(params, NEAR_CLIP, FAR_CLIP, 1.0),
+        expected,
+        rtol=1e-9,
+        atol=1e-9,
+    )
+
+
+@pytest.mark.parametrize("scale", [1.0, 0.25])
+def test_compute_frustum_planes_batch_matches_vtk(scale):
+    cameras = make_cameras()
+    planes = compute_frustum_planes_batch(cameras, NEAR_CLIP, FAR_CLIP, scale)
+
+    assert planes.shape == (len(cameras), 6, 4)
+    for camera_planes, camera in zip(planes, cameras):
+        np.testing.assert_allclose(
+            camera_planes, vtk_frustum_planes(camera, scale), rtol=1e-9, atol=1e-9
+        )
+
+
+def test_compute_frustum_planes_batch_without_cameras():
+    assert compute_frustum_planes_batch([], NEAR_CLIP, FAR_CLIP).shape == (0, 6, 4)
+
+
+def test_build_camera_frustum_matches_vtk_frustum_source():
+    for camera in make_cameras():
+        planes = vtk_frustum_planes(camera)
+
+        vtk_planes = vtkPlanes()
+        vtk_planes.SetFrustumPlanes(planes.ravel().tolist())
+        frustum_source = vtkFrustumSource()
+        frustum_source.SetPlanes(vtk_planes)
+        frustum_source.ShowLinesOff()
+        frustum_source.Update()
+        expected = vtk_to_numpy(frustum_source.GetOutput().GetPoints().GetData())
+
+        poly_data = vtkPolyData()
+        build_camera_frustum(planes, poly_data)
+        points = vtk_to_numpy(poly_data.GetPoints().GetData())
+
+        # Both store the points as float32
+        assert points.shape == (9, 3)
+        np.testing.assert_allclose(points[:8], expected, rtol=1e-5, atol=1e-4)
+        # Up-indicator tip: far top corners moved away from the far face center
+        far_center = expected[:4].mean(axis=0)
+        np.testing.assert_allclose(
+            points[8], expected[2] + expected[3] - far_center, rtol=1e-5, atol=1e-4
+        )
+        # The 6 faces of the frustum and the up-indicator triangle
+        assert poly_data.GetNumberOfPolys() == 7
+
+
+def test_batch_ned_to_enu_rotmat_matches_vtk_transform():
+    rng = np.random.default_rng(1)
+    yprs_deg = rng.uniform(-180.0, 180.0, (8, 6))
+
+    rotations = _batch_ned_to_enu_rotmat(np.deg2rad(yprs_deg))
+
+    ned_to_enu = np.array([[0.0, 1.0, 0.0], [1.0, 0.0, 0.0], [0.0, 0.0, -1.0]])
+    for rotation, ypr in zip(rotations, yprs_deg):
+        # Pre-multiplied: Rz(yaw) * Ry(pitch) * Rx(roll), platform then sensor
+        transform = vtkTransform()
+        for yaw, pitch, roll in (ypr[:3], ypr[3:]):
+            transform.RotateZ(yaw)
+            transform.RotateY(pitch)
+            transform.RotateX(roll)
+        matrix = transform.GetMatrix()
+        expected = np.array(
+            [[matrix.GetElement(i, j) for j in range(3)] for i in range(3)]
+        )
+
+        np.testing.assert_allclose(
+            rotation, ned_to_enu @ expected, rtol=1e-9, atol=1e-12
+        )
@@ -1,8 +1,20 @@
-from kwiver.vital.types import SimpleCameraPerspective
+from __future__ import annotations
+
 import numpy as np
+from vtkmodules.vtkCommonCore import vtkPoints
+from vtkmodules.vtkCommonDataModel import vtkCellArray, vtkPolyData
 from vtkmodules.vtkRenderingCore import vtkCamera
 import math
-from typing import List, NamedTuple
+from typing import TYPE_CHECKING, Dict, NamedTuple, Sequence, Tuple
+
+# kwiver is only needed for the annotations, the camera math here runs on any
+# object with the SimpleCameraPerspective accessors
+if TYPE_CHECKING:
+    from kwiver.vital.types import SimpleCameraPerspective
+
+
+_RAD2DEG = 180.0 / math.pi
+_DEG2RAD = math.pi / 180.0
 
 
 class VtkCameraBundle(NamedTuple):
@@ -10,17 +22,100 @@ class VtkCameraBundle(NamedTuple):
     aspect_ratio: float
 
 
-def create_vtk_camera_from_simple_camera(
-    simple_cam: SimpleCameraPerspective, near_clip: float, far_clip: float
-) -> VtkCameraBundle:
+class VtkCameraParams(NamedTuple):
+    position: Tuple[float, float, float]
+    view_up: Tuple[float, float, float]
+    focal_point: Tuple[float, float, float]
+    view_angle: float
+    aspect_ratio: float
+
+
+def _build_camera_params(
+    R_wc: np.ndarray,
+    center_w: Tuple[float, float, float],
+    image_width: float,
+    image_height: float,
+    focal_length: float,
+    pixel_aspect: float,
+) -> VtkCameraParams:
     """
-    Creates and configures a vtkCamera from a SimpleCameraPerspective object,
-    similar to the logic in vtkKwiverCamera::BuildCamera.
-    Returns a bundle containing the camera and its calculated aspect ratio.
+    Pure math part of create_vtk_camera_from_simple_camera: computes the
+    vtkCamera parameters from the camera pose and valid (non zero) intrinsics.
     """
-    vtk_cam = vtkCamera()
-    ci = simple_cam.intrinsics()
+    combined_aspect_ratio = pixel_aspect * image_width / image_height
+
+    # FOV (SetViewAngle is in degrees, for the vertical direction)
+    fov_deg = 2.0 * math.atan(0.5 * image_height / focal_length) * _RAD2DEG
 
+    # Camera orientation extraction - validated implementation
+    #
+    # KWIVER's rotation matrix R_wc represents a world-from-camera transformation.
+    # When transposed, R_T rows represent camera axes in world coordinates:
+    # - R_T[0, :] = camera axis 0 in world coordinates
+    # - R_T[1, :] = camera axis 1 in world coordinates  
+    # - R_T[2, :] = camera axis 2 in world coordinates
+    #
+    # Through comprehensive testing comparing TeleSculptor's C++ implementation
+    # with KWIVER's Python bindings, we determined that for VTK cameras:
+    # - View direction = R_T[0, :] (first row of transpose)
+    # - Up direction = -R_T[2, :] (negative third row of transpose)
+    #
+    # Note: TeleSculptor's C++ vtkKwiverCamera uses row(2) and -row(1), but
+    # these indices don't translate directly to Python due to differences in
+    # camera coordinate conventions between the implementations. Our empirically
+    # validated approach correctly handles aerial camera orientations.
+    
+    # Rows of R_T are the columns of R_wc, read them without transposing.
+    # All the math below is on Python floats: NumPy calls dominate the cost
+    # for 3-vectors.
+    # Camera X-axis = empirically correct view direction
+    vx, vy, vz = R_wc[:, 0].tolist()
+    # -Camera Z-axis = empirically correct up direction
+    ux, uy, uz = R_wc[:, 2].tolist()
+    up_dir_w = (-ux, -uy, -uz)
+
+    # Use a fixed distance for focal point calculation (matching TeleSculptor)
+    # This needs to be set before calling GetDistance()
+    distance_to_focal_point = 1.0  # Default VTK distance
+
+    # Normalize view direction
+    view_norm = math.sqrt(vx * vx + vy * vy + vz * vz)
+    if view_norm < 1e-6:
+        vx, vy, vz = 0.0, 0.0, 1.0
+    else:
+        inv_norm = 1.0 / view_norm
+        vx, vy, vz = vx * inv_norm, vy * inv_norm, vz * inv_norm
+
+    # Calculate focal point: center + (view * distance / |view|)
+    # Note: view is already extracted from rotation matrix, so we just normalize it
+    cx, cy, cz = center_w
+    focal_point_w = (
+        cx + vx * distance_to_focal_point,
+        cy + vy * distance_to_focal_point,
+        cz + vz * distance_to_focal_point,
+    )
+
+    return VtkCameraParams(
+        position=(cx, cy, cz),
+        view_up=up_dir_w,
+        focal_point=focal_point_w,
+        view_angle=fov_deg,
+        aspect_ratio=combined_aspect_ratio,
+    )
+
+
+class _ValidIntrinsics(NamedTuple):
+    image_width: float
+    image_height: float
+    focal_length: float
+    pixel_aspect: float
+
+
+def _valid_intrinsics(ci) -> _ValidIntrinsics:
+    """
+    Reads the intrinsics used to build a vtkCamera, replacing missing or
+    invalid values like vtkKwiverCamera::BuildCamera does.
+    """
     image_width = float(ci.image_width())
     image_height = float(ci.image_height())
     principal_point = ci.principal_point()
@@ -47,146 +142,435 @@ def create_vtk_camera_from_simple_camera(
         image_height = 1e-6
     if image_width == 0:
         image_width = 1e-6
-    if focal_length == 0:
-        focal_length = 1e-6
+    if focal_length <= 0:
+        # Missing focal length, use the common max(width, height) default
+        focal_length = max(image_width, image_height)
 
-    combined_aspect_ratio = pixel_aspect * image_width / image_height
+    return _ValidIntrinsics(image_width, image_height, focal_length, pixel_aspect)
 
-    # FOV (SetViewAngle is in degrees, for the vertical direction)
-    fov_rad = 2.0 * math.atan(0.5 * image_height / focal_length)
-    fov_deg = math.degrees(fov_rad)
-    vtk_cam.SetViewAngle(fov_deg)
 
-    # Camera pose
-    center_w = np.array(simple_cam.center().tolist())
-    R_wc = np.array(simple_cam.rotation().matrix())  # World from Camera matrix
+def create_vtk_camera_from_simple_camera(
+    simple_cam: SimpleCameraPerspective, near_clip: float, far_clip: float
+) -> VtkCameraBundle:
+    """
+    Creates and configures a vtkCamera from a SimpleCameraPerspective object,
+    similar to the logic in vtkKwiverCamera::BuildCamera.
+    Returns a bundle containing the camera and its calculated aspect ratio.
+    """
+    vtk_cam = vtkCamera()
+    aspect_ratio = configure_vtk_camera(vtk_cam, simple_cam, near_clip, far_clip)
+    return VtkCameraBundle(camera=vtk_cam, aspect_ratio=aspect_ratio)
 
-    # Camera orientation extraction - validated implementation
-    #
-    # KWIVER's rotation matrix R_wc represents a world-from-camera transformation.
-    # When transposed, R_T rows represent camera axes in world coordinates:
-    # - R_T[0, :] = camera axis 0 in world coordinates
-    # - R_T[1, :] = camera axis 1 in world coordinates  
-    # - R_T[2, :] = camera axis 2 in world coordinates
-    #
-    # Through comprehensive testing comparing TeleSculptor's C++ implementation
-    # with KWIVER's Python bindings, we determined that for VTK cameras:
-    # - View direction = R_T[0, :] (first row of transpose)
-    # - Up direction = -R_T[2, :] (negative third row of transpose)
-    #
-    # Note: TeleSculptor's C++ vtkKwiverCamera uses row(2) and -row(1), but
-    # these indices don't translate directly to Python due to differences in
-    # camera coordinate conventions between the implementations. Our empirically
-    # validated approach correctly handles aerial camera orientations.
-    
-    R_T = R_wc.T  # Transpose to access camera axes as rows
-    view_dir_w = R_T[0, :]    # Camera X-axis = empirically correct view direction
-    up_dir_w = -R_T[2, :]     # -Camera Z-axis = empirically correct up direction
 
-    vtk_cam.SetPosition(center_w[0], center_w[1], center_w[2])
-    vtk_cam.SetViewUp(up_dir_w[0], up_dir_w[1], up_dir_w[2])
+def _camera_params_from_simple_camera(
+    simple_cam: SimpleCameraPerspective,
+) -> VtkCameraParams:
+    image_width, image_height, focal_length, pixel_aspect = _valid_intrinsics(
+        simple_cam.intrinsics()
+    )
 
-    # Use a fixed distance for focal point calculation (matching TeleSculptor)
-    # This needs to be set before calling GetDistance()
-    distance_to_focal_point = 1.0  # Default VTK distance
+    # Camera pose
+    center_w = simple_cam.center().tolist()
+    # World from Camera matrix
+    R_wc = np.asarray(simple_cam.rotation().matrix(), dtype=np.float64)
 
-    # Normalize view direction
-    view_norm = np.linalg.norm(view_dir_w)
-    if view_norm < 1e-6:
-        view_dir_w_norm = np.array([0.0, 0.0, 1.0])
-    else:
-        view_dir_w_norm = view_dir_w / view_norm
+    return _build_camera_params(
+        R_wc, center_w, image_width, image_height, focal_length, pixel_aspect
+    )
 
-    # Calculate focal point: center + (view * distance / |view|)
-    # Note: view is already extracted from rotation matrix, so we just normalize it
-    focal_point_w = center_w + view_dir_w_norm * distance_to_focal_point
-    vtk_cam.SetFocalPoint(focal_point_w[0], focal_point_w[1], focal_point_w[2])
 
+def configure_vtk_camera(
+    vtk_cam: vtkCamera,
+    simple_cam: SimpleCameraPerspective,
+    near_clip: float,
+    far_clip: float,
+) -> float:
+    """
+    Sets the pose, view angle and clipping range of an existing vtkCamera
+    from a SimpleCameraPerspective, see create_vtk_camera_from_simple_camera.
+    Returns the aspect ratio to use with the camera.
+    """
+    params = _camera_params_from_simple_camera(simple_cam)
+
+    vtk_cam.SetViewAngle(params.view_angle)
+    vtk_cam.SetPosition(*params.position)
+    vtk_cam.SetViewUp(*params.view_up)
+    vtk_cam.SetFocalPoint(*params.focal_point)
     vtk_cam.SetClippingRange(near_clip, far_clip)
 
-    return VtkCameraBundle(camera=vtk_cam, aspect_ratio=combined_aspect_ratio)
+    return params.aspect_ratio
 
 
 def get_frustum_planes(
     camera_bundle: VtkCameraBundle, scale: float = 1.0
-) -> List[float]:
+) -> np.ndarray:
     """
     Calculates the frustum planes for a vtkCamera, using aspect ratio from bundle.
-    The planes will have normals pointing OUTSIDE the frustum.
-    Order: Right, Left, Bottom, Top, Near, Far.
+    The planes have normalized normals pointing INSIDE the frustum.
+    Order: Left, Right, Bottom, Top, Near, Far, as (6, 4) (A, B, C, D) rows.
+    get_frustum_planes_from_simple_camera and compute_frustum_planes_batch
+    compute the same planes without a vtkCamera and must keep this layout.
 
     Parameters:
         camera_bundle: Bundle containing the vtkCamera and its aspect ratio
         scale: Scale factor for the frustum size (1.0 = original size)
     """
-    vtk_cam = camera_bundle.camera
-    aspect = camera_bundle.aspect_ratio
+    if scale == 1.0:
+        return get_frustum_planes_unit(camera_bundle)
+    return _get_frustum_planes_scaled(camera_bundle, scale)
 
-    planes_coeffs = [0.0] * 24
-    vtk_cam.GetFrustumPlanes(aspect, planes_coeffs)
 
-    if scale == 1.0:
-        return planes_coeffs
+def get_frustum_planes_unit(camera_bundle: VtkCameraBundle) -> np.ndarray:
+    """
+    get_frustum_planes for scale 1.0: the vtkCamera frustum planes as is.
+    """
+    # VTK writes the coefficients straight into the array through its buffer
+    planes = np.empty((6, 4))
+    camera_bundle.camera.GetFrustumPlanes(camera_bundle.aspect_ratio, planes.ravel())
+    return planes
+
+
+def _get_frustum_planes_scaled(
+    camera_bundle: VtkCameraBundle, scale: float
+) -> np.ndarray:
+    vtk_cam = camera_bundle.camera
 
     # Each plane is represented by 4 coefficients (A, B, C, D) in the equation Ax + By + Cz + D = 0
     # To scale a plane relative to the camera center, we need to adjust the D coefficient
+    planes = get_frustum_planes_unit(camera_bundle)
+    normals = planes[:, :3]
 
     # Get camera center (position)
     camera_pos = np.array(vtk_cam.GetPosition())
 
-    # Process each plane (6 planes total: Right, Left, Bottom, Top, Near, Far)
-    for i in range(6):
-        # Get the normal vector (A, B, C) for this plane
-        normal = np.array(planes_coeffs[i * 4 : i * 4 + 3])
+    # Signed distance from the camera center to each plane (Ax + By + Cz + D),
+    # normals are normalized
+    projections = normals @ camera_pos
+    signed_dists = projections + planes[:, 3]
 
-        # The original D coefficient
-        d_orig = planes_coeffs[i * 4 + 3]
+    # Move each plane along its normal so that its distance from the camera
+    # center is scaled, keeping the side of the plane the camera is on:
+    # new_D = -dot(normal, camera_pos) - |dist| * sign(dist) * scale, where
+    # |dist| * sign(dist) is just dist
+    planes[:, 3] = -projections - signed_dists * scale
 
-        # Calculate the distance from the camera center to the plane
-        # Using the plane equation: Ax + By + Cz + D = 0
-        # distance = |Ax + By + Cz + D| / √(A² + B² + C²)
-        # Since we're using normalized normals, the denominator is 1
-        dist_to_plane = abs(np.dot(normal, camera_pos) + d_orig)
+    return planes
 
-        # To scale the plane's distance from the camera center:
-        # 1. First, determine if the plane is "in front of" or "behind" the camera
-        # (we use the sign of Ax + By + Cz + D)
-        sign = 1 if np.dot(normal, camera_pos) + d_orig > 0 else -1
 
-        # 2. Adjust the distance by scale factor
-        new_dist = dist_to_plane * scale
+def get_frustum_planes_from_simple_camera(
+    simple_cam: SimpleCameraPerspective,
+    near_clip: float,
+    far_clip: float,
+    scale: float = 1.0,
+) -> np.ndarray:
+    """
+    Calculates the frustum planes of the vtkCamera that
+    create_vtk_camera_from_simple_camera would build, without building it.
+
+    Parameters:
+        simple_cam: The SimpleCameraPerspective object
+        near_clip: The near clipping plane distance
+        far_clip: The far clipping plane distance
+        scale: Scale factor for the frustum size (1.0 = original size)
+    """
+    return _frustum_planes_from_params(
+        _camera_params_from_simple_camera(simple_cam), near_clip, far_clip, scale
+    )
+
 
-        # 3. Calculate the new D coefficient
-        # new_D = -dot(normal, point_on_plane)
-        # For a point on the plane at distance new_dist from camera along normal:
-        # point_on_plane = camera_pos + normal * new_dist * sign
-        # So new_D = -dot(normal, camera_pos + normal * new_dist * sign)
-        #          = -dot(normal, camera_pos) - new_dist * sign
-        new_d = -np.dot(normal, camera_pos) - new_dist * sign
+def _frustum_planes_from_params(
+    params: VtkCameraParams, near_clip: float, far_clip: float, scale: float
+) -> np.ndarray:
+    """
+    Same planes as vtkCamera.GetFrustumPlanes (see get_frustum_planes) for a
+    camera set up with params, computed on Python floats.
+    """
+    px, py, pz = params.position
+    fx, fy, fz = params.focal_point
+    # Direction of projection
+    dx, dy, dz = fx - px, fy - py, fz - pz
+    inv_norm = 1.0 / math.sqrt(dx * dx + dy * dy + dz * dz)
+    dx, dy, dz = dx * inv_norm, dy * inv_norm, dz * inv_norm
+    # Orthonormal side and up axes, as in the vtkCamera view transform
+    ux, uy, uz = params.view_up
+    sx, sy, sz = dy * uz - dz * uy, dz * ux - dx * uz, dx * uy - dy * ux
+    inv_norm = 1.0 / math.sqrt(sx * sx + sy * sy + sz * sz)
+    sx, sy, sz = sx * inv_norm, sy * inv_norm, sz * inv_norm
+    ux, uy, uz = sy * dz - sz * dy, sz * dx - sx * dz, sx * dy - sy * dx
+
+    # vtkCamera clamps the view angle to [1e-8, 179] degrees
+    view_angle = min(max(params.view_angle, 1e-8), 179.0)
+    tan_v = math.tan(0.5 * view_angle * _DEG2RAD)
+    tan_h = tan_v * params.aspect_ratio
+
+    # Side planes: the side or up axis tilted toward the direction of
+    # projection by the half view angle, normalized
+    planes = []
+    for ax, ay, az, tan_half in (
+        (sx, sy, sz, tan_h),
+        (-sx, -sy, -sz, tan_h),
+        (ux, uy, uz, tan_v),
+        (-ux, -uy, -uz, tan_v),
+    ):
+        inv_norm = 1.0 / math.sqrt(1.0 + tan_half * tan_half)
+        nx = (ax + tan_half * dx) * inv_norm
+        ny = (ay + tan_half * dy) * inv_norm
+        nz = (az + tan_half * dz) * inv_norm
+        planes.append([nx, ny, nz, -(nx * px + ny * py + nz * pz)])
+    projection = dx * px + dy * py + dz * pz
+    planes.append([dx, dy, dz, -projection - near_clip])
+    planes.append([-dx, -dy, -dz, projection + far_clip])
+
+    planes = np.array(planes)
+    if scale != 1.0:
+        # Same D adjustment as get_frustum_planes
+        projections = planes[:, :3] @ (px, py, pz)
+        signed_dists = projections + planes[:, 3]
+        planes[:, 3] = -projections - signed_dists * scale
+    return planes
+
+
+def extract_camera_soa(
+    simple_cams: Sequence[SimpleCameraPerspective],
+) -> Dict[str, np.ndarray]:
+    """
+    Reads the pose and intrinsics of many cameras into one array per field,
+    with the same intrinsics fallbacks as create_vtk_camera_from_simple_camera.
 
-        # Update the D coefficient in the planes array
-        planes_coeffs[i * 4 + 3] = new_d
+    Returns:
+        dict with "centers" (N, 3), "rotations" (N, 3, 3) world from camera
+        matrices, "image_sizes" (N, 2) width and height, "focal_lengths" (N,)
+        and "pixel_aspects" (N,)
+    """
+    intrinsics = [cam.intrinsics() for cam in simple_cams]
+    image_sizes = np.array(
+        [[ci.image_width(), ci.image_height()] for ci in intrinsics], dtype=float
+    )
+    principal_points = np.array(
+        [ci.principal_point() for ci in intrinsics], dtype=float
+    )
+    pixel_aspects = np.array([ci.aspect_ratio() for ci in intrinsics], dtype=float)
+    focal_lengths = np.array([ci.focal_length() for ci in intrinsics], dtype=float)
+    centers = np.array([cam.center() for cam in simple_cams], dtype=float)
+    rotations = np.array([cam.rotation().matrix() for cam in simple_cams], dtype=float)
+
+    # Same fallbacks as create_vtk_camera_from_simple_camera
+    invalid_size = (image_sizes[:, 0] <= 0) | (image_sizes[:, 1] <= 0)
+    pp_size = np.where(
+        ((principal_points[:, 0] > 0) & (principal_points[:, 1] > 0))[:, None],
+        principal_points * 2.0,
+        1.0,
+    )
+    image_sizes = np.where(invalid_size[:, None], pp_size, image_sizes)
+    image_sizes[image_sizes == 0] = 1e-6
+    pixel_aspects[pixel_aspects == 0] = 1.0
+    focal_lengths = np.where(
+        focal_lengths > 0, focal_lengths, image_sizes.max(axis=1)
+    )
 
-    return planes_coeffs
+    return {
+        "centers": centers,
+        "rotations": rotations,
+        "image_sizes": image_sizes,
+        "focal_lengths": focal_lengths,
+        "pixel_aspects": pixel_aspects,
+    }
 
 
-def get_frustum_planes_from_simple_camera(
-    simple_cam: SimpleCameraPerspective,
+def compute_frustum_planes_batch(
+    simple_cams: Sequence[SimpleCameraPerspective],
     near_clip: float,
     far_clip: float,
     scale: float = 1.0,
-) -> List[float]:
+) -> np.ndarray:
     """
-    Creates a vtkCamera from a SimpleCameraPerspective and then calculates its frustum planes.
+    Calculates the frustum planes of many cameras at once.
+
+    Equivalent to calling get_frustum_planes_from_simple_camera on each camera
+    (same order and orientation as vtkCamera.GetFrustumPlanes: left, right,
+    bottom, top, near, far with normals pointing inside the frustum), but
+    computed with NumPy over all the cameras at once.
 
     Parameters:
-        simple_cam: The SimpleCameraPerspective object
+        simple_cams: The SimpleCameraPerspective objects
         near_clip: The near clipping plane distance
         far_clip: The far clipping plane distance
         scale: Scale factor for the frustum size (1.0 = original size)
+
+    Returns:
+        (N, 6, 4) array, the 6 (A, B, C, D) planes of each camera
+    """
+    n_cams = len(simple_cams)
+    if n_cams == 0:
+        return np.empty((0, 6, 4))
+
+    soa = extract_camera_soa(simple_cams)
+    centers = soa["centers"]
+    R_wc = soa["rotations"]
+    image_sizes = soa["image_sizes"]
+    focal_lengths = soa["focal_lengths"]
+    pixel_aspects = soa["pixel_aspects"]
+
+    # Tangents of the vertical and horizontal half view angles, with the view
+    # angle clamped to vtkCamera's [1e-8, 179] degrees range
+    half_view_angles = np.arctan(0.5 * image_sizes[:, 1] / focal_lengths)
+    tan_v = np.tan(
+        np.clip(half_view_angles, math.radians(0.5e-8), math.radians(89.5))
+    )
+    tan_h = tan_v * pixel_aspects * image_sizes[:, 0] / image_sizes[:, 1]
+
+    # VTK camera axes in world coordinates, see create_vtk_camera_from_simple_camera
+    view_dirs = R_wc[:, :, 0]
+    view_norms = np.linalg.norm(view_dirs, axis=1)
+    degenerate = view_norms < 1e-6
+    view_dirs = np.where(
+        degenerate[:, None],
+        [0.0, 0.0, 1.0],
+        view_dirs / np.where(degenerate, 1.0, view_norms)[:, None],
+    )
+    up_dirs = -R_wc[:, :, 2]
+    side_dirs = np.cross(view_dirs, up_dirs)
+    side_dirs /= np.linalg.norm(side_dirs, axis=1)[:, None]
+    up_dirs = np.cross(side_dirs, view_dirs)
+
+    # Left, right, bottom and top normals all at once: the side axis tilted
+    # toward the view direction by the half view angle, normalized
+    side_axes = np.stack([side_dirs, -side_dirs, up_dirs, -up_dirs], axis=1)
+    tangents = np.stack([tan_h, tan_h, tan_v, tan_v], axis=1)
+    side_normals = side_axes + tangents[:, :, None] * view_dirs[:, None, :]
+
+    planes = np.empty((n_cams, 6, 4))
+    planes[:, :4, :3] = side_normals / np.sqrt(1.0 + tangents * tangents)[:, :, None]
+    planes[:, 4, :3] = view_dirs
+    planes[:, 5, :3] = -view_dirs
+
+    projections = np.einsum("npi,ni->np", planes[:, :, :3], centers)
+    planes[:, :, 3] = -projections
+    planes[:, 4, 3] -= near_clip
+    planes[:, 5, 3] += far_clip
+
+    if scale != 1.0:
+        # Same D adjustment as get_frustum_planes
+        signed_dists = projections + planes[:, :, 3]
+        planes[:, :, 3] = -projections - signed_dists * scale
+
+    return planes
+
+
+def _ypr_to_rotmat(cos_ypr, sin_ypr, ned_to_enu=False):
+    """
+    Stack of rotation matrices Rz(yaw) * Ry(pitch) * Rx(roll), the convention
+    of RotationD(yaw, pitch, roll), from (N, 3) cosines and sines of the angles.
+
+    With ned_to_enu, the NED to ENU basis change is applied to the result.
     """
-    camera_bundle = create_vtk_camera_from_simple_camera(
-        simple_cam, near_clip, far_clip
+    cy, cp, cr = cos_ypr.T
+    sy, sp, sr = sin_ypr.T
+    rows = [
+        [cy * cp, cy * sp * sr - sy * cr, cy * sp * cr + sy * sr],
+        [sy * cp, sy * sp * sr + cy * cr, sy * sp * cr - cy * sr],
+        [-sp, cp * sr, cp * cr],
+    ]
+    if ned_to_enu:
+        # Swap the north and east rows, negate down
+        rows = [rows[1], rows[0], [-value for value in rows[2]]]
+    return np.stack([value for row in rows for value in row], axis=-1).reshape(
+        -1, 3, 3
     )
-    planes_coeffs = get_frustum_planes(camera_bundle, scale)
-    return planes_coeffs
+
+
+def _batch_ned_to_enu_rotmat(yprs_rad):
+    """
+    Camera rotation matrices from platform and sensor orientation angles.
+
+    Batched equivalent of kwiver's
+    ned_to_enu(RotationD(*platform_ypr) * RotationD(*sensor_ypr)).
+
+    Args:
+        yprs_rad: (N, 6) array of [platform yaw, pitch, roll,
+                  sensor yaw, pitch, roll] in radians
+
+    Returns:
+        (N, 3, 3) array of rotation matrices
+    """
+    c = np.cos(yprs_rad)
+    s = np.sin(yprs_rad)
+
+    # ned_to_enu(platform * sensor) == ned_to_enu(platform) * sensor, so the
+    # basis change is folded into building the platform matrices
+    platform_enu = _ypr_to_rotmat(c[:, 0:3], s[:, 0:3], ned_to_enu=True)
+    sensor_ned = _ypr_to_rotmat(c[:, 3:6], s[:, 3:6])
+    return np.matmul(platform_enu, sensor_ned)
+
+
+# Plane indices (left, right, bottom, top, near, far) meeting at each frustum
+# corner, in vtkFrustumSource point order:
+# Far plane: 0:FBL, 1:FBR, 2:FTR, 3:FTL
+# Near plane: 4:NBL, 5:NBR, 6:NTR, 7:NTL
+_FRUSTUM_CORNER_PLANES = np.array(
+    [
+        [0, 2, 5],
+        [1, 2, 5],
+        [1, 3, 5],
+        [0, 3, 5],
+        [0, 2, 4],
+        [1, 2, 4],
+        [1, 3, 4],
+        [0, 3, 4],
+    ]
+)
+# The 6 quad faces of vtkFrustumSource followed by the up-indicator triangle,
+# which uses the far plane's top edge (FTR, FTL) and the tip point (8).
+# Copied into each frustum's polydata.
+_FRUSTUM_POLYS = vtkCellArray()
+for _face in (
+    (4, 0, 3, 7),
+    (1, 5, 6, 2),
+    (0, 4, 5, 1),
+    (3, 2, 6, 7),
+    (0, 1, 2, 3),
+    (4, 7, 6, 5),
+    (2, 3, 8),
+):
+    _FRUSTUM_POLYS.InsertNextCell(len(_face), _face)
+del _face
+# p2 + p3 - 0.25 * (p0 + p1 + p2 + p3) as weights of the far corners
+_FRUSTUM_TIP_WEIGHTS = np.array([-0.25, -0.25, 0.75, 0.75])
+
+
+def build_camera_frustum(planes_coefficients: np.ndarray, out_poly_data: vtkPolyData):
+    """
+    Builds a camera frustum including an up-indicator triangle, similar to
+    the C++ BuildCameraFrustum function, from the (6, 4) frustum planes.
+
+    The 8 corners are solved directly from the plane equations rather than
+    running a vtkFrustumSource, keeping the same point and face layout.
+    """
+    planes = np.asarray(planes_coefficients, dtype=float).reshape(6, 4)
+    corner_planes = planes[_FRUSTUM_CORNER_PLANES]  # (8, 3, 4)
+    try:
+        corners = np.linalg.solve(
+            corner_planes[:, :, :3], -corner_planes[:, :, 3:]
+        )[:, :, 0]
+    except np.linalg.LinAlgError:
+        # Degenerate planes, no frustum to build
+        return
+
+    # Tip of the up-indicator triangle, simplified from C++:
+    # new = p2 + p3 - center, where p2 and p3 are the top corners of the far
+    # plane and center is the center of the far face.
+    tip = _FRUSTUM_TIP_WEIGHTS @ corners[:4]
+
+    points = vtkPoints()
+    points.SetNumberOfPoints(9)
+    set_point = points.SetPoint
+    for i, corner in enumerate(corners.tolist()):
+        set_point(i, corner)
+    set_point(8, tip.tolist())
+
+    polys = vtkCellArray()
+    polys.DeepCopy(_FRUSTUM_POLYS)
+
+    out_poly_data.SetPoints(points)
+    out_poly_data.SetPolys(polys)
+    out_poly_data.Modified()
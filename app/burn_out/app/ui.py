@@ -1,11 +1,15 @@
 from .assets import ASSETS
 from trame.widgets import quasar, html
 
+# Closes the enclosing menu when the item is clicked
+_CLOSE_POPUP = dict(raw_attrs=["v-close-popup"])
+
 
 class VideoControls(html.Div):
     def __init__(
         self,
         current_frame="video_current_frame",
+        current_frame_preview="video_current_frame_preview",
         n_frames="video_n_frames",
         play_status="video_playing",
         play_speed="video_play_speed",
@@ -19,12 +23,18 @@ class VideoControls(html.Div):
         )
 
         self.server.state.setdefault(play_status, False)
+        # Frame under the slider thumb while dragging, only shown in the UI
+        self.server.state.setdefault(current_frame_preview, None)
+        self.server.state.client_only(current_frame_preview)
 
         with self:
+            # Only commit the frame (and so decode and push it) on release
             quasar.QSlider(
                 classes="col no-transition",
                 style="min-width:12rem",
-                v_model=(current_frame, 1),
+                model_value=(current_frame, 1),
+                update_model_value=f"{current_frame_preview} = $event",
+                change=f"{current_frame} = $event; {current_frame_preview} = null",
                 min=(1,),
                 max=(n_frames, 1),
                 step=(1,),
@@ -35,7 +45,8 @@ class VideoControls(html.Div):
             ):
                 quasar.QInput(
                     classes="col-auto",
-                    v_model_number=(current_frame, 1),
+                    model_value=(f"{current_frame_preview} ?? {current_frame}",),
+                    update_model_value=f"{current_frame} = Number($event)",
                     outlined=True,
                     type="number",
                     dense=True,
@@ -44,7 +55,7 @@ class VideoControls(html.Div):
                 # avoid class=col so button isn't squashed.
                 quasar.QBtn(
                     size="sm",
-                    v_show=f"!{play_status}",
+                    v_if=f"!{play_status}",
                     round=True,
                     icon="play_arrow",
                     color="green",
@@ -52,16 +63,18 @@ class VideoControls(html.Div):
                 )
                 quasar.QBtn(
                     size="sm",
-                    v_show=f"{play_status}",
+                    v_if=f"{play_status}",
                     round=True,
                     icon="stop",
                     color="red",
                     click=f"{play_status} = false",
                 )
+                # Like the frame slider, only commit the speed on release
                 quasar.QSlider(
                     classes="col-grow",
                     style="width:7.25rem",
-                    v_model=(play_speed, 60),
+                    model_value=(play_speed, 60),
+                    change=f"{play_speed} = $event",
                     min=(-20,),
                     max=(60,),
                     step=(1,),
@@ -107,6 +120,10 @@ def generate_about_content():
 """
 
 
+# The content is static, build it once
+_ABOUT_HTML = generate_about_content()
+
+
 class AboutDialog(html.Div):
     def __init__(
         self,
@@ -124,7 +141,7 @@ class AboutDialog(html.Div):
                     style="top: 0.1rem; left: 0.1rem; bottom: 0.1rem; right: 0.1rem;",
                 ):
                     with quasar.QCardSection() as qs:
-                        qs.add_child(generate_about_content())
+                        qs.add_child(_ABOUT_HTML)
 
 
 class FileMenu(html.Div):
@@ -139,14 +156,13 @@ class FileMenu(html.Div):
         **kwargs,
     ):
         super().__init__("File", classes="cursor-pointer non-selectable")
-        close_popup = dict(raw_attrs=["v-close-popup"])
         with self:
             with quasar.QMenu():
                 with quasar.QList(dense=True, style="min-width: 200px"):
                     with quasar.QItem(
                         clickable=True,
                         click=on_menu_file_open,
-                        **close_popup,
+                        **_CLOSE_POPUP,
                     ):
                         with quasar.QItemSection(style="max-width: 20px;"):
                             quasar.QIcon(name="folder", size="xs")
@@ -169,7 +185,7 @@ class FileMenu(html.Div):
                             with quasar.QList(dense=True, style="min-width: 100px"):
                                 with quasar.QItem(
                                     clickable=True,
-                                    **close_popup,
+                                    **_CLOSE_POPUP,
                                     click=on_menu_file_export_meta,
                                 ):
                                     quasar.QItemSection(
@@ -178,7 +194,7 @@ class FileMenu(html.Div):
                                     )
                                 with quasar.QItem(
                                     clickable=True,
-                                    **close_popup,
+                                    **_CLOSE_POPUP,
                                     click=on_menu_file_export_klv,
                                 ):
                                     quasar.QItemSection(
@@ -187,7 +203,7 @@ class FileMenu(html.Div):
                                     )
                     # with quasar.QItem(
                     #    clickable=True,
-                    #    **close_popup,
+                    #    **_CLOSE_POPUP,
                     #    click=on_menu_file_remove_burnin,
                     #    disable=True,
                     # ):
@@ -200,7 +216,7 @@ class FileMenu(html.Div):
                     quasar.QSeparator()
                     with quasar.QItem(
                         clickable=True,
-                        **close_popup,
+                        **_CLOSE_POPUP,
                         click=on_menu_file_cancel,
                     ):
                         with quasar.QItemSection(style="max-width: 20px;"):
@@ -211,7 +227,7 @@ class FileMenu(html.Div):
                     quasar.QSeparator()
                     with quasar.QItem(
                         clickable=True,
-                        **close_popup,
+                        **_CLOSE_POPUP,
                         click=on_menu_file_quit,
                     ):
                         with quasar.QItemSection(style="max-width: 20px;"):
@@ -232,14 +248,13 @@ class ViewMenu(html.Div):
         **kwargs,
     ):
         super().__init__("View", classes="cursor-pointer non-selectable")
-        close_popup = dict(raw_attrs=["v-close-popup"])
         with self:
             with quasar.QMenu():
                 with quasar.QList(dense=True, style="min-width: 200px"):
                     with quasar.QItem(
                         clickable=True,
                         click=on_menu_view_play,
-                        **close_popup,
+                        **_CLOSE_POPUP,
                     ):
                         with quasar.QItemSection(style="max-width: 20px;"):
                             quasar.QIcon(name="play_arrow", size="xs")
@@ -250,7 +265,7 @@ class ViewMenu(html.Div):
                     with quasar.QItem(
                         clickable=True,
                         click=on_menu_view_loop,
-                        **close_popup,
+                        **_CLOSE_POPUP,
                     ):
                         with quasar.QItemSection(style="max-width: 20px;"):
                             quasar.QIcon(name="repeat", size="xs")
@@ -262,7 +277,7 @@ class ViewMenu(html.Div):
                     #    clickable=True,
                     #    click=on_menu_view_reset,
                     #    disable=True,
-                    #    **close_popup,
+                    #    **_CLOSE_POPUP,
                     # ):
                     #    with quasar.QItemSection(style="max-width: 20px;"):
                     #        quasar.QIcon(name="crop_free", size="xs")
@@ -274,7 +289,7 @@ class ViewMenu(html.Div):
                     #    clickable=True,
                     #    click=on_menu_view_reset,
                     #    disable=True,
-                    #    **close_popup,
+                    #    **_CLOSE_POPUP,
                     # ):
                     #    with quasar.QItemSection(style="max-width: 20px;"):
                     #        quasar.QIcon(name="palette", size="xs")
@@ -289,10 +304,9 @@ class ViewMenu(html.Div):
                     ):
                         with quasar.QItemSection(style="max-width: 20px;"):
                             quasar.QIcon(
-                                name=(
-                                    "show_view_metadata ? 'visibility' : 'visibility_off'",
-                                ),
+                                name="visibility",
                                 size="xs",
+                                classes=("show_view_metadata ? '' : 'icon-off'",),
                             )
                         quasar.QItemSection(
                             "Metadata", classes="cursor-pointer non-selectable"
@@ -303,10 +317,9 @@ class ViewMenu(html.Div):
                     ):
                         with quasar.QItemSection(style="max-width: 20px;"):
                             quasar.QIcon(
-                                name=(
-                                    "show_view_log ? 'visibility' : 'visibility_off'",
-                                ),
+                                name="visibility",
                                 size="xs",
+                                classes=("show_view_log ? '' : 'icon-off'",),
                             )
                         quasar.QItemSection(
                             "Log Viewer", classes="cursor-pointer non-selectable"
@@ -321,7 +334,6 @@ class HelpMenu(html.Div):
         **kwargs,
     ):
         super().__init__("Help", classes="cursor-pointer non-selectable")
-        close_popup = dict(raw_attrs=["v-close-popup"])
         with self:
             with quasar.QMenu():
                 with quasar.QList(dense=True, style="min-width: 200px"):
@@ -329,7 +341,7 @@ class HelpMenu(html.Div):
                     #    clickable=True,
                     #    click=on_menu_help_manual,
                     #    disable=True,
-                    #    **close_popup,
+                    #    **_CLOSE_POPUP,
                     # ):
                     #    with quasar.QItemSection(style="max-width: 20px;"):
                     #        quasar.QIcon(name="question_mark", size="xs")
@@ -341,7 +353,7 @@ class HelpMenu(html.Div):
                     with quasar.QItem(
                         clickable=True,
                         click=on_menu_help_about,
-                        **close_popup,
+                        **_CLOSE_POPUP,
                     ):
                         with quasar.QItemSection(style="max-width: 20px;"):
                             html.Img(src=ASSETS.favicon, style="height: 20px")
@@ -1,5 +1,5 @@
 import asyncio
-import time
+import numpy as np
 from trame.app import asynchronous
 
 
@@ -17,41 +17,43 @@ def create_throttler(interval):
         async function that accepts either a sync or async function to throttle
     """
     # State held in closure
-    last_run_time = 0
-    pending_task = None
-    has_pending_request = False
-
-    async def _delayed_call(func, delay):
-        nonlocal last_run_time, has_pending_request
-        await asyncio.sleep(delay)
-        if has_pending_request:  # Only run if there's still a pending request
-            last_run_time = time.time()
-            has_pending_request = False
-            if asyncio.iscoroutinefunction(func):
-                await func()
-            else:
-                func()
+    last_run_time = None
+    timer = None  # asyncio.TimerHandle of the pending call
+    pending_func = None
+
+    def _delayed_call():
+        nonlocal last_run_time, timer, pending_func
+        func = pending_func
+        timer = None
+        pending_func = None
+        last_run_time = asyncio.get_event_loop().time()
+        if asyncio.iscoroutinefunction(func):
+            asynchronous.create_task(func())
+        else:
+            func()
 
     async def throttled_call(func):
-        nonlocal last_run_time, pending_task, has_pending_request
+        nonlocal last_run_time, timer, pending_func
 
-        current_time = time.time()
-        time_since_last_run = current_time - last_run_time
+        loop = asyncio.get_event_loop()
+        current_time = loop.time()
 
-        if time_since_last_run >= interval:
+        if last_run_time is None or current_time - last_run_time >= interval:
             # Run immediately - first call or enough time has passed
             last_run_time = current_time
-            has_pending_request = False
+            if timer is not None:
+                timer.cancel()
+                timer = None
+                pending_func = None
             if asyncio.iscoroutinefunction(func):
                 await func()
             else:
                 func()
         else:
-            # Schedule for later and mark that we have a pending request
-            has_pending_request = True
-            if pending_task is None or pending_task.done():
-                delay = interval - time_since_last_run
-                pending_task = asynchronous.create_task(_delayed_call(func, delay))
+            # Schedule for later, the latest request is the one that runs
+            pending_func = func
+            if timer is None:
+                timer = loop.call_at(last_run_time + interval, _delayed_call)
 
     return throttled_call
 
@@ -61,13 +63,14 @@ async def wait_for_network_and_time(server, target_duration):
     Waits for the server to complete network operations and then sleeps
     for the remaining time to match the target duration.
     """
-    start_time = asyncio.get_event_loop().time()
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + target_duration
     await server.network_completion
-    network_time = asyncio.get_event_loop().time() - start_time
 
-    remaining_time = target_duration - network_time
+    remaining_time = deadline - loop.time()
 
-    if remaining_time > 0:
+    # Not worth scheduling a sleep for less than a millisecond
+    if remaining_time > 0.001:
         await asyncio.sleep(remaining_time)
 
 
@@ -76,25 +79,58 @@ class VideoAdapter:
         self.area_name = name
         self.streamer = None
         self.meta = None
+        # Key of the last pushed frame, to skip pushing it again
+        self.frame_key = None
+        # Two alternating buffers to pack non contiguous frames into, so the
+        # frame being packed is never the one still being sent
+        self._frame_buffers = [None, None]
+        self._frame_buffer_index = 0
         self.on_streamer_set = (
             on_streamer_set  # Callback to be called when streamer is set
         )
 
     def set_streamer(self, stream_manager):
         self.streamer = stream_manager
+        self.frame_key = None
         if self.on_streamer_set:
             self.on_streamer_set()
 
     def clear(self):
         self.meta = None
-
-    def update_frame(self, kwiver_image):
+        self.frame_key = None
+        self._frame_buffers = [None, None]
+
+    def update_frame(self, kwiver_image, frame_key=None):
+        """
+        Pushes the image to the client, unless frame_key is given and is the
+        key of the last pushed frame.
+        """
+        if frame_key is not None and frame_key == self.frame_key:
+            return
+        self.frame_key = frame_key
         if self.meta is None:
             self.meta = dict(
                 type="image/rgb24",
                 w=int(kwiver_image.width()),
                 h=int(kwiver_image.height()),
             )
+        frame = kwiver_image.asarray()
+        if not frame.flags.c_contiguous:
+            # e.g. a view on an image with padded rows or planar channels
+            frame = self._pack_frame(frame)
+        # Flat byte view of the pixels, no copy
         self.streamer.push_content(
-            self.area_name, self.meta, memoryview(kwiver_image.asarray().ravel())
+            self.area_name, self.meta, memoryview(frame).cast("B")
         )
+
+    def _pack_frame(self, frame):
+        """
+        Copies a non contiguous frame into the next reusable buffer.
+        """
+        self._frame_buffer_index ^= 1
+        buffer = self._frame_buffers[self._frame_buffer_index]
+        if buffer is None or buffer.shape != frame.shape or buffer.dtype != frame.dtype:
+            buffer = np.empty(frame.shape, dtype=frame.dtype)
+            self._frame_buffers[self._frame_buffer_index] = buffer
+        np.copyto(buffer, frame)
+        return buffer
@@ -5,16 +5,18 @@ from pathlib import Path
 from kwiver.vital import plugin_management
 from kwiver.vital import vital_logging
 import logging
+import os
 import sys
 import asyncio
-from multiprocessing import Queue
-from burn_out.app.metadata_serializer import serialize, deserialize
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing import Queue, Value
+from burn_out.app.metadata_serializer import serialize_to_file, deserialize_file
 from burn_out.multiprocess_worker import (
     create_worker,
     send_task,
     await_result,
     close_worker,
-    cancel_worker,
 )
 
 logger = vital_logging.getLogger(__name__)
@@ -27,13 +29,18 @@ stream_handler.setFormatter(formatter)
 logger.addHandler(stream_handler)
 
 
-def video_worker(task_queue: Queue, result_queue: Queue):
-    """Worker function for video metadata processing."""
+def video_worker(task_queue: Queue, result_queue: Queue, cancel_generation):
+    """Worker function for video metadata processing.
+
+    Extractions sent before cancel_generation was last incremented stop at
+    the next frame, see VideoImporter.cancel.
+    """
     original_metadata = None  # Keep original metadata for writing
     vpm = plugin_management.plugin_manager_instance()
     vpm.load_all_plugins()
 
     while True:
+        json_path = None
         try:
             task = task_queue.get()
             if task is None:
@@ -43,9 +50,24 @@ def video_worker(task_queue: Queue, result_queue: Queue):
                 func_name, args = task
 
                 if func_name == "extract_metadata":
-                    original_metadata = _extract_metadata(*args)
-                    json_metadata = serialize(original_metadata)
-                    result_queue.put(json_metadata)
+                    video_path, config_path, json_path, generation = args
+
+                    def is_cancelled():
+                        return cancel_generation.value != generation
+
+                    original_metadata = _extract_metadata(
+                        video_path, config_path, is_cancelled
+                    )
+                    # Extraction results carry their json_path, which
+                    # identifies the run they belong to
+                    if is_cancelled():
+                        original_metadata = None
+                        result_queue.put(("extract_cancelled", json_path))
+                    else:
+                        # Hand the metadata over through a file rather than
+                        # pickling the whole JSON string through the queue
+                        serialize_to_file(original_metadata, json_path)
+                        result_queue.put(("extract_complete", json_path))
                 elif func_name == "write_metadata":
                     if original_metadata is not None:
                         _write_metadata(original_metadata, *args)
@@ -57,7 +79,10 @@ def video_worker(task_queue: Queue, result_queue: Queue):
             break
         except Exception as e:
             logger.error(f"Worker error: {e}")
-            result_queue.put(f"error: {e}")
+            if json_path is not None:
+                result_queue.put(("extract_error", json_path))
+            else:
+                result_queue.put(f"error: {e}")
 
 
 class VideoImporter:
@@ -65,55 +90,193 @@ class VideoImporter:
 
     def __init__(self, metadata_callback):
         self.metadata_callback = metadata_callback
-        self.worker = create_worker(video_worker)
+        # Incremented to cancel the extractions sent so far, shared with the
+        # worker so cancelling does not need to restart it
+        self.cancel_generation = Value("i", 0)
+        self.worker = create_worker(video_worker, self.cancel_generation)
+        # json_path -> (worker process, future of the extraction result),
+        # resolved by the single task reading the results, see _dispatch_results
+        self._pending_extractions = {}
+        self._dispatch_task = None
 
     def run(self, video_path, config_path):
         """Extract metadata from the video given in video_path using a reader
         constructed based on config_path"""
-        self.worker = send_task(
-            self.worker, ("extract_metadata", (video_path, config_path))
-        )
+        # The worker writes the metadata to json_path, see video_worker
+        fd, json_path = tempfile.mkstemp(suffix=".json")
+        os.close(fd)
+        task_args = (video_path, config_path, json_path, self.cancel_generation.value)
+        self.worker = send_task(self.worker, ("extract_metadata", task_args))
+
+        result_future = asyncio.get_event_loop().create_future()
+        self._pending_extractions[json_path] = (self.worker.process, result_future)
+        if self._dispatch_task is None or self._dispatch_task.done():
+            self._dispatch_task = asyncio.create_task(self._dispatch_results())
 
         # Start a task to await results and call metadata callback
-        asyncio.create_task(self._await_metadata_results())
+        asyncio.create_task(self._await_metadata_results(json_path, result_future))
 
     def write(self, path, config_path):
         """Write previously extracted data to path"""
         self.worker = send_task(self.worker, ("write_metadata", (path, config_path)))
 
     def cancel(self):
-        """Cancel current operations and restart worker"""
-        self.worker = cancel_worker(self.worker)
+        """Cancel the running and queued metadata extractions, keeping the
+        worker and its loaded plugins"""
+        with self.cancel_generation.get_lock():
+            self.cancel_generation.value += 1
 
     def close(self):
         """Close the worker process"""
         close_worker(self.worker)
 
-    async def _await_metadata_results(self):
+    async def _dispatch_results(self):
+        """Read the worker results while extractions are pending, resolving
+        each pending extraction with its own result. Other results (exports,
+        runs no longer awaited) are dropped."""
+        while self._pending_extractions:
+            worker = self.worker
+            _, result = await await_result(worker)
+            if result is None:
+                # The worker died, the extractions sent to it are lost. The
+                # ones sent after send_task restarted it are still pending.
+                for json_path, (process, future) in list(
+                    self._pending_extractions.items()
+                ):
+                    if process is worker.process:
+                        del self._pending_extractions[json_path]
+                        future.set_result(None)
+                continue
+
+            if isinstance(result, tuple) and len(result) == 2:
+                status, json_path = result
+                pending = self._pending_extractions.pop(json_path, None)
+                if pending is not None:
+                    pending[1].set_result(status)
+
+    async def _await_metadata_results(self, json_path, result_future):
         """Await metadata results from the worker process and call the metadata callback"""
-        self.worker, result = await await_result(self.worker)
-
-        if (
-            result
-            and result != "write_complete"
-            and result != "write_error"
-            and not result.startswith("error:")
-        ):
-            deserialized_metadata = deserialize(result)
-            if deserialized_metadata is not None and self.metadata_callback:
-                if asyncio.iscoroutinefunction(self.metadata_callback):
-                    await self.metadata_callback(deserialized_metadata)
-                else:
-                    self.metadata_callback(deserialized_metadata)
-
-
-def _extract_metadata(video_path, config_path):
-    config = read_config_file(str(config_path))
-    if not VideoInput.check_nested_algo_configuration("video_reader", config):
-        logger.warn("An error was found in the video source algorithm configuration.")
+        deserialized_metadata = None
+        try:
+            result = await result_future
+            if result == "extract_complete":
+                deserialized_metadata = deserialize_file(json_path)
+        finally:
+            if os.path.exists(json_path):
+                os.unlink(json_path)
+
+        if deserialized_metadata is not None and self.metadata_callback:
+            if asyncio.iscoroutinefunction(self.metadata_callback):
+                await self.metadata_callback(deserialized_metadata)
+            else:
+                self.metadata_callback(deserialized_metadata)
+
+
+class InProcessVideoImporter:
+    """VideoImporter alternative extracting the metadata in a thread of this
+    process, handing it to the metadata callback without serializing it."""
+
+    def __init__(self, metadata_callback):
+        self.metadata_callback = metadata_callback
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.metadata = None  # Keep metadata for writing
+        # Incremented to cancel the extractions started so far
+        self.cancel_generation = 0
+
+    def run(self, video_path, config_path):
+        """Extract metadata from the video given in video_path using a reader
+        constructed based on config_path"""
+        asyncio.create_task(self._extract_metadata(video_path, config_path))
+
+    def write(self, path, config_path):
+        """Write previously extracted data to path"""
+        if self.metadata is None:
+            logger.warning("No metadata to write")
+            return
+        self.executor.submit(_write_metadata, self.metadata, path, config_path)
+
+    def cancel(self):
+        """Cancel the running and queued metadata extractions"""
+        self.cancel_generation += 1
+
+    def close(self):
+        """Cancel the metadata extractions, keeping the thread so the importer
+        still works when a client reconnects"""
+        # Not shut down: an idle thread is joined at interpreter exit, and a
+        # new one could race the cancelled extraction on the cached reader
+        self.cancel()
+
+    async def _extract_metadata(self, video_path, config_path):
+        generation = self.cancel_generation
+
+        def is_cancelled():
+            return self.cancel_generation != generation
+
+        loop = asyncio.get_event_loop()
+        try:
+            metadata = await loop.run_in_executor(
+                self.executor, _extract_metadata, video_path, config_path, is_cancelled
+            )
+        except Exception as e:
+            logger.error("Metadata extraction error: %s", e)
+            return
+        if metadata is None or is_cancelled():
+            return
+
+        self.metadata = metadata
+        metadata_map = SimpleMetadataMap(metadata)
+        if self.metadata_callback:
+            if asyncio.iscoroutinefunction(self.metadata_callback):
+                await self.metadata_callback(metadata_map)
+            else:
+                self.metadata_callback(metadata_map)
+
+
+# Configured algorithms of the process extracting metadata (the worker, or the
+# server with InProcessVideoImporter), reused across tasks since building them
+# from a config file is costly
+_video_readers = {}  # config path -> VideoInput
+_metadata_writers = {}  # (config path, writer type) -> MetadataMapIO
+
+
+def _get_video_reader(config_path):
+    video_reader = _video_readers.get(str(config_path))
+    if video_reader is None:
+        config = read_config_file(str(config_path))
+        if not VideoInput.check_nested_algo_configuration("video_reader", config):
+            logger.warn(
+                "An error was found in the video source algorithm configuration."
+            )
+            return None
+
+        video_reader = VideoInput.set_nested_algo_configuration("video_reader", config)
+        _video_readers[str(config_path)] = video_reader
+    return video_reader
+
+
+def _get_metadata_writer(config_path, writer_type):
+    key = (str(config_path), writer_type)
+    metadata_writer = _metadata_writers.get(key)
+    if metadata_writer is None:
+        config = read_config_file(config_path)
+        config["metadata_writer:type"] = writer_type
+
+        # TODO: check what this exactly does in C++
+        #  d->freestandingConfig->merge_config(config);
+        #
+        metadata_writer = MetadataMapIO.set_nested_algo_configuration(
+            "metadata_writer", config
+        )
+        if metadata_writer is not None:
+            _metadata_writers[key] = metadata_writer
+    return metadata_writer
+
+
+def _extract_metadata(video_path, config_path, is_cancelled=lambda: False):
+    video_reader = _get_video_reader(config_path)
+    if video_reader is None:
         return
 
-    video_reader = VideoInput.set_nested_algo_configuration("video_reader", config)
     video_reader.open(video_path)
 
     frame_metadata = dict()
@@ -126,14 +289,18 @@ def _extract_metadata(video_path, config_path):
     #  return
 
     current_timestamp = Timestamp()
-    while video_reader.next_frame(current_timestamp):
-        if not current_timestamp.has_valid_frame():
-            continue
+    try:
+        while not is_cancelled() and video_reader.next_frame(current_timestamp):
+            if not current_timestamp.has_valid_frame():
+                continue
 
-        frame = current_timestamp.get_frame()
-        metadata = video_reader.frame_metadata()
-        if len(metadata) > 0:
-            frame_metadata[frame] = metadata
+            frame = current_timestamp.get_frame()
+            metadata = video_reader.frame_metadata()
+            if len(metadata) > 0:
+                frame_metadata[frame] = metadata
+    finally:
+        # Close so the cached reader can open the next video
+        video_reader.close()
 
     logger.debug("Done reading metadata")
     return frame_metadata
@@ -145,16 +312,8 @@ def _write_metadata(data, metadata_path, config_path):
     if Path(metadata_path).suffix == ".csv":
         writer_type = "csv"
 
-    config = read_config_file(config_path)
-    config["metadata_writer:type"] = writer_type
-
-    # TODO: check what this exactly does in C++
-    #  d->freestandingConfig->merge_config(config);
-    #
     try:
-        metadata_serializer = MetadataMapIO.set_nested_algo_configuration(
-            "metadata_writer", config
-        )
+        metadata_serializer = _get_metadata_writer(config_path, writer_type)
         if metadata_serializer is None:
             logger.error("Error saving metadata")
         smm = SimpleMetadataMap(data)
@@ -3,7 +3,6 @@ import numpy as np
 from vtkmodules.vtkCommonDataModel import (
     vtkPolyData,
     vtkCellArray,
-    vtkPlanes,
     vtkTriangle,
 )
 from vtkmodules.vtkCommonCore import vtkPoints
@@ -14,7 +13,6 @@ from vtkmodules.vtkRenderingCore import (
     vtkRenderer,
     vtkRenderWindow,
 )
-from vtkmodules.vtkFiltersSources import vtkFrustumSource
 from vtkmodules.vtkFiltersCore import vtkAppendPolyData
 
 from trame.decorators import TrameApp, change
@@ -23,6 +21,8 @@ from trame.app import asynchronous
 import logging
 
 from .scene.utils import (
+    build_camera_frustum,
+    compute_frustum_planes_batch,
     get_frustum_planes_from_simple_camera,  # Added
 )
 from .utils import create_throttler
@@ -36,6 +36,7 @@ NEAR_CLIP = 0.01
 FAR_CLIP_INACTIVE = 4.0  # TeleSculptor's NonActiveCameraRepLength default
 FAR_CLIP_ACTIVE = 15.0  # TeleSculptor's ActiveCameraRepLength default
 FRUSTUM_SCALE = 1
+FRUSTUM_DISPLAY_DENSITY = 10  # Draw the frustum of one in this many cameras
 UPDATE_THROTTLE_INTERVAL = 0.1  # 10fps during video playback
 
 # TeleSculptor default UI scale values
@@ -80,71 +81,6 @@ def calculate_frustum_far_clip(camera_centers: Sequence[Sequence[float]],
     return max(frustum_far_clip, min_clip)
 
 
-def build_camera_frustum(
-    planes_coefficients: Sequence[float], out_poly_data: vtkPolyData
-):
-    """
-    Builds a camera frustum including an up-indicator triangle, similar to
-    the C++ BuildCameraFrustum function.
-    """
-    planes_object = vtkPlanes()
-    planes_object.SetFrustumPlanes(planes_coefficients)
-
-    frustum_source = vtkFrustumSource()
-    frustum_source.SetPlanes(planes_object)
-    frustum_source.ShowLinesOff()  # Generates 5 faces (no lines) and 8 points
-    frustum_source.Update()
-
-    # Make a copy of the frustum mesh so we can modify it
-    out_poly_data.DeepCopy(frustum_source.GetOutput())
-    frustum_points = out_poly_data.GetPoints()
-    frustum_polys = out_poly_data.GetPolys()
-
-    if not frustum_points or frustum_points.GetNumberOfPoints() != 8:
-        # Expected 8 points for the frustum (4 near, 4 far)
-        return
-
-    # Points from vtkFrustumSource (ShowLinesOff=True):
-    # Far plane: 0:FBL, 1:FBR, 2:FTR, 3:FTL
-    # Near plane: 4:NBL, 5:NBR, 6:NTR, 7:NTL
-
-    p0_fbl = np.array(frustum_points.GetPoint(0))  # Far Bottom Left
-    p1_fbr = np.array(frustum_points.GetPoint(1))  # Far Bottom Right
-    p2_ftr = np.array(frustum_points.GetPoint(2))  # Far Top Right
-    p3_ftl = np.array(frustum_points.GetPoint(3))  # Far Top Left
-
-    # Calculate the center of the far face
-    center_face = 0.25 * (p0_fbl + p1_fbr + p2_ftr + p3_ftl)
-
-    # Calculate the new tip point for the up-indicator triangle
-    # new = top_edge_midpoint + (top_edge_midpoint - center_face_midpoint_along_up_vector)
-    # Simplified from C++: new = p2 + p3 - center
-    # where p2 and p3 are the top corners of the far plane.
-    tip_coord = p2_ftr + p3_ftl - center_face
-
-    # Insert new point for the tip of the up-indicator
-    tip_point_id = frustum_points.InsertNextPoint(
-        tip_coord[0], tip_coord[1], tip_coord[2]
-    )
-
-    # Create the up-indicator triangle using the far plane's top edge points
-    # and the new tip point.
-    # The C++ code uses original indices 2 and 3 for the triangle.
-    # Index 2 from frustum_source output is FTR.
-    # Index 3 from frustum_source output is FTL.
-    up_triangle = vtkTriangle()
-    up_triangle.GetPointIds().SetId(0, 2)  # Far Top Right (original index 2)
-    up_triangle.GetPointIds().SetId(1, 3)  # Far Top Left (original index 3)
-    up_triangle.GetPointIds().SetId(2, tip_point_id)
-
-    if frustum_polys is None:
-        frustum_polys = vtkCellArray()
-        out_poly_data.SetPolys(frustum_polys)
-
-    frustum_polys.InsertNextCell(up_triangle)
-    out_poly_data.Modified()
-
-
 class Positions_Rep(NamedTuple):
     poly_data: vtkPolyData
     mapper: vtkPolyDataMapper
@@ -181,14 +117,14 @@ class Pipeline(NamedTuple):
 
 
 def update_points(points: vtkPoints, lines: vtkCellArray, point_data: Sequence[float]):
-    point_ids = []
-    for point in point_data:
-        point_id = points.InsertNextPoint(point[0], point[1], point[2])
-        point_ids.append(point_id)
+    # Bind the VTK methods called per point once
+    insert_point = points.InsertNextPoint
+    point_ids = [insert_point(point[0], point[1], point[2]) for point in point_data]
 
     lines.InsertNextCell(len(point_ids))
+    insert_cell_point = lines.InsertCellPoint
     for point_id in point_ids:
-        lines.InsertCellPoint(point_id)
+        insert_cell_point(point_id)
 
 
 def update_positions_rep(positions_rep: Positions_Rep, point_data: Sequence[float]):
@@ -296,6 +232,7 @@ def create_active_frustum_rep(renderer: vtkRenderer):
 
 def update_frustums_rep(frustums_rep: Frustums_Rep, frustums, display_density: int = 1):
     frustums_rep.append_poly_data.RemoveAllInputs()
+    add_input_data = frustums_rep.append_poly_data.AddInputData
 
     any_frustum_added = False
 
@@ -307,7 +244,7 @@ def update_frustums_rep(frustums_rep: Frustums_Rep, frustums, display_density: i
         build_camera_frustum(planes_coefficients, individual_frustum_poly_data)
 
         if individual_frustum_poly_data.GetNumberOfPoints() > 0:
-            frustums_rep.append_poly_data.AddInputData(individual_frustum_poly_data)
+            add_input_data(individual_frustum_poly_data)
             any_frustum_added = True
 
     if not any_frustum_added:
@@ -320,7 +257,7 @@ def update_frustums_rep(frustums_rep: Frustums_Rep, frustums, display_density: i
 
 
 def update_active_frustum_rep(active_frustum_rep: ActiveFrustum_Rep, frustum_planes):
-    if frustum_planes:
+    if frustum_planes is not None:
         build_camera_frustum(frustum_planes, active_frustum_rep.poly_data)
     else:
         active_frustum_rep.poly_data.Initialize()
@@ -338,41 +275,9 @@ def create_ground_plan_grid(
         divisions: Number of grid divisions per side
         z_level: Z coordinate for the ground plane
     """
-    points = vtkPoints()
-    lines = vtkCellArray()
-
-    half_size = size / 2.0
-    step = size / divisions
-
-    # Create horizontal lines (constant Y, varying X)
-    for i in range(divisions + 1):
-        y = -half_size + i * step
-
-        # Line from (-half_size, y, z_level) to (half_size, y, z_level)
-        p1_id = points.InsertNextPoint(-half_size, y, z_level)
-        p2_id = points.InsertNextPoint(half_size, y, z_level)
-
-        lines.InsertNextCell(2)
-        lines.InsertCellPoint(p1_id)
-        lines.InsertCellPoint(p2_id)
-
-    # Create vertical lines (constant X, varying Y)
-    for i in range(divisions + 1):
-        x = -half_size + i * step
-
-        # Line from (x, -half_size, z_level) to (x, half_size, z_level)
-        p1_id = points.InsertNextPoint(x, -half_size, z_level)
-        p2_id = points.InsertNextPoint(x, half_size, z_level)
-
-        lines.InsertNextCell(2)
-        lines.InsertCellPoint(p1_id)
-        lines.InsertCellPoint(p2_id)
-
-    poly_data = vtkPolyData()
-    poly_data.SetPoints(points)
-    poly_data.SetLines(lines)
-
-    return poly_data
+    return create_ground_plan_grid_with_center(
+        size, 0.0, 0.0, z_level, divisions=divisions
+    )
 
 
 def create_ground_plan_rep(renderer: vtkRenderer):
@@ -464,29 +369,34 @@ def create_ground_plan_grid_with_center(
     half_size = size / 2.0
     step = size / divisions
 
+    # Bind the VTK methods called per line once
+    insert_point = points.InsertNextPoint
+    insert_cell = lines.InsertNextCell
+    insert_cell_point = lines.InsertCellPoint
+
     # Create horizontal lines (constant Y, varying X)
     for i in range(divisions + 1):
         y = center_y - half_size + i * step
 
         # Line from (center_x - half_size, y, z_level) to (center_x + half_size, y, z_level)
-        p1_id = points.InsertNextPoint(center_x - half_size, y, z_level)
-        p2_id = points.InsertNextPoint(center_x + half_size, y, z_level)
+        p1_id = insert_point(center_x - half_size, y, z_level)
+        p2_id = insert_point(center_x + half_size, y, z_level)
 
-        lines.InsertNextCell(2)
-        lines.InsertCellPoint(p1_id)
-        lines.InsertCellPoint(p2_id)
+        insert_cell(2)
+        insert_cell_point(p1_id)
+        insert_cell_point(p2_id)
 
     # Create vertical lines (constant X, varying Y)
     for i in range(divisions + 1):
         x = center_x - half_size + i * step
 
         # Line from (x, center_y - half_size, z_level) to (x, center_y + half_size, z_level)
-        p1_id = points.InsertNextPoint(x, center_y - half_size, z_level)
-        p2_id = points.InsertNextPoint(x, center_y + half_size, z_level)
+        p1_id = insert_point(x, center_y - half_size, z_level)
+        p2_id = insert_point(x, center_y + half_size, z_level)
 
-        lines.InsertNextCell(2)
-        lines.InsertCellPoint(p1_id)
-        lines.InsertCellPoint(p2_id)
+        insert_cell(2)
+        insert_cell_point(p1_id)
+        insert_cell_point(p2_id)
 
     poly_data = vtkPolyData()
     poly_data.SetPoints(points)
@@ -521,6 +431,9 @@ class WorldView:
         self.pipeline = create_pipeline()
         self.active_camera_id = None
         self.camera_map = {}
+        self.camera_centers = []
+        # Depends only on the camera map, computed in _update_cameras
+        self._active_frustum_far_clip = FAR_CLIP_ACTIVE
         self._camera_reset_done = False  # Track if camera has been reset already
         self._throttled_update = create_throttler(UPDATE_THROTTLE_INTERVAL)
 
@@ -536,8 +449,18 @@ class WorldView:
         self.pipeline.renderer.ResetCamera()
         self.html_view.push_camera()
 
-    def update_camera_map(self, camera_map):
+    def update_camera_map(self, camera_map, camera_centers=None):
+        """
+        camera_centers: optional (N, 3) array of the camera_map centers, in
+        order, to avoid reading them back from the cameras
+        """
         self.camera_map = camera_map
+        if camera_centers is None:
+            self.camera_centers = [
+                camera.center().tolist() for camera in camera_map.values()
+            ]
+        else:
+            self.camera_centers = camera_centers.tolist()
         self._update_cameras()
         # Update active camera for initial display when camera map is loaded
         if camera_map:
@@ -555,14 +478,10 @@ class WorldView:
         active_camera = camera_map.get(active_camera_id)
 
         if active_camera:
-            # Calculate active camera frustum with dynamic scaling
-            camera_centers = [cam.center().tolist() for cam in self.camera_map.values()]
-            active_frustum_far_clip = calculate_frustum_far_clip(camera_centers, is_active=True)
-
             active_frustum_planes = get_frustum_planes_from_simple_camera(
                 active_camera,  # Use original camera, not scaled
                 NEAR_CLIP,
-                active_frustum_far_clip,
+                self._active_frustum_far_clip,
                 FRUSTUM_SCALE,
             )
             update_active_frustum_rep(
@@ -579,7 +498,7 @@ class WorldView:
 
     def _update_cameras(self):
         camera_map = getattr(self, "camera_map", {})
-        centers = [camera.center().tolist() for camera in camera_map.values()]
+        centers = self.camera_centers
 
         # Use original camera positions (not scaled) for visualization
         # TeleSculptor doesn't scale camera positions, only frustum sizes
@@ -587,20 +506,22 @@ class WorldView:
 
         # Calculate dynamic frustum scale based on scene bounds
         frustum_far_clip = calculate_frustum_far_clip(centers, is_active=False)
+        self._active_frustum_far_clip = calculate_frustum_far_clip(
+            centers, is_active=True
+        )
 
         # Generate frustums from original cameras (not scaled positions)
-        # Only the frustum size is adjusted based on scene scale
-        frustums = (
-            get_frustum_planes_from_simple_camera(
-                cam,
-                NEAR_CLIP,
-                frustum_far_clip,
-                FRUSTUM_SCALE,
-            )
-            for cam in camera_map.values()
+        # Only the frustum size is adjusted based on scene scale.
+        # Only every FRUSTUM_DISPLAY_DENSITY-th camera is drawn, skip the
+        # others before computing planes
+        frustums = compute_frustum_planes_batch(
+            list(camera_map.values())[::FRUSTUM_DISPLAY_DENSITY],
+            NEAR_CLIP,
+            frustum_far_clip,
+            FRUSTUM_SCALE,
         )
 
-        update_frustums_rep(self.pipeline.frustums_rep, frustums, 10)
+        update_frustums_rep(self.pipeline.frustums_rep, frustums)
 
         # Show frustums when cameras are available, hide dummy otherwise
         self.pipeline.frustums_rep.actor.SetVisibility(len(camera_map) > 0)
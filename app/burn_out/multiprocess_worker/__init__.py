@@ -11,28 +11,37 @@ from typing import Any, Callable, NamedTuple, Optional, Tuple
 class WorkerHandle(NamedTuple):
     """Immutable worker process handle."""
 
-    worker_func: Callable[[Queue, Queue], None]
+    worker_func: Callable[..., None]
     task_queue: Queue
     result_queue: Queue
     process: Process
+    worker_args: Tuple[Any, ...] = ()
 
 
-def create_worker(worker_func: Callable[[Queue, Queue], None]) -> WorkerHandle:
+def create_worker(worker_func: Callable[..., None], *worker_args: Any) -> WorkerHandle:
     """Create a new worker process.
 
     Args:
         worker_func: Function that runs in worker process.
-                    Must accept (task_queue, result_queue) as arguments.
+                    Must accept (task_queue, result_queue, *worker_args) as arguments.
+        *worker_args: Extra arguments for worker_func, passed again when the
+                    worker is restarted. Use them for objects that can only be
+                    shared with the process when it starts, like
+                    multiprocessing.Event or Value.
 
     Returns:
         WorkerHandle for the created worker
     """
     task_queue = Queue()
     result_queue = Queue()
-    process = Process(target=worker_func, args=(task_queue, result_queue), daemon=True)
+    process = Process(
+        target=worker_func,
+        args=(task_queue, result_queue, *worker_args),
+        daemon=True,
+    )
     process.start()
 
-    return WorkerHandle(worker_func, task_queue, result_queue, process)
+    return WorkerHandle(worker_func, task_queue, result_queue, process, worker_args)
 
 
 def send_task(worker: WorkerHandle, task: Any) -> WorkerHandle:
@@ -47,7 +56,7 @@ def send_task(worker: WorkerHandle, task: Any) -> WorkerHandle:
     """
     # Restart if process is dead
     if not worker.process.is_alive():
-        worker = create_worker(worker.worker_func)
+        worker = create_worker(worker.worker_func, *worker.worker_args)
 
     worker.task_queue.put(task)
     return worker
@@ -136,7 +145,7 @@ def cancel_worker(worker: WorkerHandle) -> WorkerHandle:
         if worker.process.is_alive():
             worker.process.kill()
 
-    return create_worker(worker.worker_func)
+    return create_worker(worker.worker_func, *worker.worker_args)
 
 
 # Example worker functions
@@ -8,7 +8,7 @@ import asyncio
 import pytest
 import sys
 import time
-from multiprocessing import Queue
+from multiprocessing import Queue, Value
 
 from . import create_worker, send_and_await, close_worker, send_task, await_result
 
@@ -86,6 +86,15 @@ def stateful_worker(task_queue: Queue, result_queue: Queue):
             result_queue.put({"status": "error", "error": str(e)})
 
 
+def shared_value_worker(task_queue: Queue, result_queue: Queue, shared_value):
+    """Worker that reports a value shared with the parent process."""
+    for task in iter(task_queue.get, None):
+        try:
+            result_queue.put(f"{task}: {shared_value.value}")
+        except (KeyboardInterrupt, SystemExit):
+            break
+
+
 class TestWorker:
     """Test suite for functional multiprocess worker."""
 
@@ -268,6 +277,32 @@ class TestWorker:
         finally:
             close_worker(worker)
 
+    @pytest.mark.asyncio
+    async def test_worker_args(self):
+        """Test extra worker arguments are shared and kept across restarts."""
+        from . import cancel_worker
+
+        shared_value = Value("i", 1)
+        worker = create_worker(shared_value_worker, shared_value)
+
+        try:
+            worker, result = await send_and_await(worker, "first")
+            assert result == "first: 1"
+
+            # Changes from the parent are seen by the worker
+            shared_value.value = 2
+            worker, result = await send_and_await(worker, "second")
+            assert result == "second: 2"
+
+            # A restarted worker gets the same arguments
+            worker = cancel_worker(worker)
+            shared_value.value = 3
+            worker, result = await send_and_await(worker, "third")
+            assert result == "third: 3"
+
+        finally:
+            close_worker(worker)
+
     @pytest.mark.asyncio
     async def test_graceful_shutdown(self):
         """Test graceful shutdown behavior."""